@@ -129,6 +129,7 @@ def create_analysis_scripts():
 
 import sys
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -148,21 +149,44 @@ def run_batch_analysis(data_file):
     analyzer = ComprehensiveAnalyzer()
     results = []
     
-    for _, row in df.iterrows():
+    # Subjects sharing a birth time and place (to ~100 m) share one chart
+    df['key'] = list(zip(df['birth_datetime'], df['latitude'].round(3), df['longitude'].round(3)))
+    unique_charts = {}
+    for key in df['key'].unique():
+        birth_datetime, latitude, longitude = key
+        try:
+            unique_charts[key] = analyzer.chart_calc.calculate_chart(
+                datetime.fromisoformat(birth_datetime), latitude, longitude
+            )
+        except Exception as e:
+            print(f"Error calculating chart for {birth_datetime} at ({latitude}, {longitude}): {e}")
+    
+    # Score traditional dignities for every unique chart in one vectorized call
+    chart_strengths = {}
+    if unique_charts:
+        dignity_calc = analyzer.dignity_correlation.dignity_calc
+        chart_keys = list(unique_charts)
+        signs_idx = np.stack([dignity_calc.traditional_sign_ids(unique_charts[key]) for key in chart_keys])
+        strengths = dignity_calc.calculate_batch(signs_idx).sum(axis=1)
+        chart_strengths = dict(zip(chart_keys, strengths.tolist()))
+    
+    for row in df.itertuples(index=False):
+        if row.key not in unique_charts:
+            print(f"Error processing {row.subject_id}: no birth chart")
+            continue
         try:
-            result = analyzer.comprehensive_astro_genetic_analysis(
-                birth_datetime=datetime.fromisoformat(row['birth_datetime']),
-                latitude=row['latitude'],
-                longitude=row['longitude'],
-                genetic_file_path=row['genetic_file']
+            result = analyzer.comprehensive_chart_analysis(
+                chart=unique_charts[row.key],
+                genetic_file_path=row.genetic_file
             )
             results.append({
-                'subject_id': row['subject_id'],
+                'subject_id': row.subject_id,
                 'correlation': result.overall_correlation,
-                'confidence': result.confidence_level
+                'confidence': result.confidence_level,
+                'chart_strength': chart_strengths[row.key]
             })
         except Exception as e:
-            print(f"Error processing {row['subject_id']}: {e}")
+            print(f"Error processing {row.subject_id}: {e}")
     
     # Save results
     results_df = pd.DataFrame(results)
@@ -3,56 +3,302 @@
 import swisseph as swe
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
+from dataclasses import InitVar, dataclass
 
-@dataclass
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    _NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels below remain plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Longitudes are also kept as whole arcseconds so sign lookups are integer math
+ARCSEC_PER_SIGN = 30 * 3600
+
+# One contiguous record per planet in BirthChart.planets_arr
+PLANET_DTYPE = np.dtype([
+    ('longitude', np.float64),
+    ('latitude', np.float64),
+    ('distance', np.float64),
+    ('speed', np.float64),
+    ('deg_in_sign', np.float64),
+    ('longitude_arcsec', np.uint32),
+    ('house', np.int8),
+    ('sign_id', np.int8)
+])
+
+def _quantize_jd(jd: float) -> float:
+    """Round a Julian day to millisecond precision so equal instants share a cache key"""
+    return round(jd * 86400000.0) / 86400000.0
+
+def _quantize_degrees(value: float) -> float:
+    """Round a geographic coordinate to 1e-6 degrees for cache keys"""
+    return round(value, 6)
+
+@lru_cache(maxsize=16384)
+def _calc_planet_raw(jd_q: float, planet_id: int) -> Tuple[float, float, float, float]:
+    """Cached Swiss Ephemeris position (longitude, latitude, distance, speed)"""
+    result, flag = swe.calc_ut(jd_q, planet_id)
+    return result[0], result[1], result[2], result[3]
+
+@lru_cache(maxsize=4096)
+def _houses_raw(jd_q: float, lat_q: float, lon_q: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Cached Placidus house cusps and angles"""
+    return swe.houses(jd_q, lat_q, lon_q, b'P')
+
+# The kernels compile on first use. They are not cached on disk because a
+# cached kernel only loads under the module name it was compiled with
+# (astrological.* vs src.astrological.*).
+@njit()
+def _find_house_nb(longitude, houses):
+    """House number (1-12) for one longitude given 12 house cusps"""
+    origin = houses[0]
+    rel_longitude = (longitude - origin) % 360.0
+    house = 1
+    for i in range(1, 12):
+        if (houses[i] - origin) % 360.0 <= rel_longitude:
+            house = i + 1
+    return house
+
+@njit()
+def _assign_houses_nb(longitudes, houses):
+    """House numbers for an array of longitudes"""
+    out = np.empty(longitudes.shape[0], dtype=np.int64)
+    for i in range(longitudes.shape[0]):
+        out[i] = _find_house_nb(longitudes[i], houses)
+    return out
+
+@njit()
+def _aspects_nb(longs, targets, orb):
+    """First matching aspect for every planet pair within orb
+    
+    Returns an (M, 3) array of (planet1, planet2, aspect) indices together
+    with the separation angle and orb of each match.
+    """
+    n = longs.shape[0]
+    max_pairs = n * (n - 1) // 2
+    pairs = np.empty((max_pairs, 3), dtype=np.int64)
+    angles = np.empty(max_pairs, dtype=np.float64)
+    orbs = np.empty(max_pairs, dtype=np.float64)
+    count = 0
+    
+    for i in range(n):
+        for j in range(i + 1, n):
+            angle = abs(longs[i] - longs[j])
+            if angle > 180.0:
+                angle = 360.0 - angle
+            
+            for k in range(targets.shape[0]):
+                aspect_orb = abs(angle - targets[k])
+                if aspect_orb <= orb:
+                    pairs[count, 0] = i
+                    pairs[count, 1] = j
+                    pairs[count, 2] = k
+                    angles[count] = angle
+                    orbs[count] = aspect_orb
+                    count += 1
+                    break
+    
+    return pairs[:count], angles[:count], orbs[:count]
+
+def _aspects_np(longs: np.ndarray, targets: np.ndarray, orb: float,
+                pair_i: np.ndarray, pair_j: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy equivalent of _aspects_nb over precomputed upper-triangular pairs"""
+    # Pairwise angular separation folded into [0, 180]
+    diff = np.abs(longs[pair_i] - longs[pair_j])
+    diff = np.minimum(diff, 360 - diff)
+    
+    # (n_pairs, n_aspects) orb matrix; the first aspect within orb wins
+    orb_matrix = np.abs(diff[:, None] - targets)
+    hits = orb_matrix <= orb
+    matched = np.flatnonzero(hits.any(axis=1))
+    k_idx = hits[matched].argmax(axis=1)
+    
+    pairs = np.stack([pair_i[matched], pair_j[matched], k_idx], axis=1)
+    return pairs, diff[matched], orb_matrix[matched, k_idx]
+
+class _SignName:
+    """``PlanetPosition.sign``: the sign name resolved from ``sign_id``
+    
+    Read on the class it returns None, which dataclasses takes as the
+    default of the ``sign`` constructor argument.
+    """
+    
+    def __get__(self, position, owner=None) -> Optional[str]:
+        if position is None or position.sign_id is None:
+            return None
+        return ChartCalculator.SIGNS[position.sign_id]
+
+@dataclass(frozen=True, slots=True)
 class PlanetPosition:
-    """Represents a planet's position and metadata"""
+    """Represents a planet's position and metadata
+    
+    The sign is stored as ``sign_id``; ``sign`` is still accepted by the
+    constructor (in its original position) and readable as the sign name.
+    Positions are immutable: those read from ``BirthChart.planets`` are
+    snapshots of the chart's records, so assigning to them fails rather
+    than being silently lost.
+    """
     longitude: float
     latitude: float
     distance: float
     speed: float
     house: Optional[int] = None
-    sign: Optional[str] = None
+    sign: InitVar[Optional[str]] = _SignName()
     degree_in_sign: Optional[float] = None
+    sign_id: Optional[int] = None
+    
+    def __post_init__(self, sign: Optional[str]):
+        """Resolve a sign name passed to the constructor into ``sign_id``"""
+        if sign is not None:
+            sign_id = ChartCalculator.SIGNS.index(sign)
+            if self.sign_id is not None and self.sign_id != sign_id:
+                raise ValueError(f"sign {sign!r} does not match sign_id {self.sign_id}")
+            object.__setattr__(self, 'sign_id', sign_id)
 
-@dataclass
+@dataclass(frozen=True, eq=False, slots=True)
 class BirthChart:
-    """Complete birth chart data structure"""
+    """Complete birth chart data structure
+    
+    Planet data is stored as one PLANET_DTYPE record per planet, indexed like
+    ``planet_names``; the per-field array properties are views into it and
+    ``planets`` exposes the same data as PlanetPosition objects.
+    """
     datetime: datetime
     latitude: float
     longitude: float
-    planets: Dict[str, PlanetPosition]
+    planet_names: Tuple[str, ...]
+    planets_arr: np.ndarray
     houses: List[float]
     ascendant: float
     midheaven: float
+    
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self.planets_arr['longitude']
+    
+    @property
+    def longitudes_arcsec(self) -> np.ndarray:
+        return self.planets_arr['longitude_arcsec']
+    
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self.planets_arr['latitude']
+    
+    @property
+    def distances(self) -> np.ndarray:
+        return self.planets_arr['distance']
+    
+    @property
+    def speeds(self) -> np.ndarray:
+        return self.planets_arr['speed']
+    
+    @property
+    def houses_idx(self) -> np.ndarray:
+        return self.planets_arr['house']
+    
+    @property
+    def signs_idx(self) -> np.ndarray:
+        return self.planets_arr['sign_id']
+    
+    @property
+    def planets(self) -> Mapping:
+        """Read-only mapping of planet name to PlanetPosition"""
+        return _PlanetView(self)
+
+@lru_cache(maxsize=None)
+def _planet_index(planet_names: Tuple[str, ...]) -> Dict[str, int]:
+    """Planet name -> record index, shared by every chart with these planets"""
+    return {name: i for i, name in enumerate(planet_names)}
+
+class _PlanetView(Mapping):
+    """Lazy name -> PlanetPosition view over a BirthChart's planet records
+    
+    Each lookup builds a fresh, frozen PlanetPosition from the record, so
+    repeated lookups compare equal but are not the same object.
+    """
+    
+    def __init__(self, chart: BirthChart):
+        self._chart = chart
+        self._index = _planet_index(chart.planet_names)
+    
+    def __getitem__(self, name: str) -> PlanetPosition:
+        row = self._chart.planets_arr[self._index[name]]
+        return PlanetPosition(
+            longitude=float(row['longitude']),
+            latitude=float(row['latitude']),
+            distance=float(row['distance']),
+            speed=float(row['speed']),
+            house=int(row['house']),
+            sign_id=int(row['sign_id']),
+            degree_in_sign=float(row['deg_in_sign'])
+        )
+    
+    def __contains__(self, name) -> bool:
+        return name in self._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chart.planet_names)
+    
+    def __len__(self) -> int:
+        return len(self._chart.planet_names)
 
 class ChartCalculator:
     """Advanced astrological chart calculator with Swiss Ephemeris precision"""
     
-    PLANETS = {
-        'sun': swe.SUN,
-        'moon': swe.MOON,
-        'mercury': swe.MERCURY,
-        'venus': swe.VENUS,
-        'mars': swe.MARS,
-        'jupiter': swe.JUPITER,
-        'saturn': swe.SATURN,
-        'uranus': swe.URANUS,
-        'neptune': swe.NEPTUNE,
-        'pluto': swe.PLUTO
-    }
+    PLANETS = (
+        ('sun', swe.SUN),
+        ('moon', swe.MOON),
+        ('mercury', swe.MERCURY),
+        ('venus', swe.VENUS),
+        ('mars', swe.MARS),
+        ('jupiter', swe.JUPITER),
+        ('saturn', swe.SATURN),
+        ('uranus', swe.URANUS),
+        ('neptune', swe.NEPTUNE),
+        ('pluto', swe.PLUTO)
+    )
     
     SIGNS = [
         'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
     ]
     
+    MAJOR_ASPECTS = {
+        'conjunction': 0,
+        'sextile': 60,
+        'square': 90,
+        'trine': 120,
+        'opposition': 180
+    }
+    
+    DEFAULT_EPHE_PATH = '/usr/share/swisseph'  # Adjust path as needed
+    
+    # Swiss Ephemeris state is process-wide, so the path is set once and shared
+    _ephe_initialized = False
+    _ephe_path: Optional[str] = None
+    
     def __init__(self):
         """Initialize calculator with Swiss Ephemeris"""
-        # Set ephemeris path if needed
-        swe.set_ephe_path('/usr/share/swisseph')  # Adjust path as needed
+        if not ChartCalculator._ephe_initialized:
+            ChartCalculator.configure_ephe(self.DEFAULT_EPHE_PATH)
+        
+        self._names = tuple(name for name, _ in self.PLANETS)
+        self._ids = np.array([planet_id for _, planet_id in self.PLANETS], dtype=np.int32)
+        
+        # Aspect search tables shared by every chart
+        self._pair_i, self._pair_j = np.triu_indices(len(self.PLANETS), 1)
+        self._aspect_names = list(self.MAJOR_ASPECTS.keys())
+        self._aspect_angles = list(self.MAJOR_ASPECTS.values())
+        self._targets = np.array(self._aspect_angles, dtype=np.float64)
     
     def calculate_chart(self, birth_datetime: datetime, latitude: float, longitude: float) -> BirthChart:
         """Calculate complete birth chart with high precision
@@ -65,66 +311,119 @@ class ChartCalculator:
         Returns:
             BirthChart object with all planetary positions and houses
         """
+        return self._build_chart(birth_datetime, latitude, longitude,
+                                 _quantize_degrees(latitude), _quantize_degrees(longitude))
+    
+    def specialize(self, latitude: float, longitude: float) -> Callable[[datetime], BirthChart]:
+        """Return a chart function bound to one birth location
+        
+        Useful for cohorts born in the same place: the coordinates are
+        quantized once and only the birth time varies per call.
+        
+        Args:
+            latitude: Geographic latitude
+            longitude: Geographic longitude
+            
+        Returns:
+            Function mapping a birth datetime (UTC) to its BirthChart
+        """
+        lat_q = _quantize_degrees(latitude)
+        lon_q = _quantize_degrees(longitude)
+        build_chart = self._build_chart
+        
+        def calculate_chart_at(birth_datetime: datetime) -> BirthChart:
+            return build_chart(birth_datetime, latitude, longitude, lat_q, lon_q)
+        
+        return calculate_chart_at
+    
+    def _build_chart(self, birth_datetime: datetime, latitude: float, longitude: float,
+                     lat_q: float, lon_q: float) -> BirthChart:
+        """Calculate a chart given coordinates already quantized for the house cache"""
         # Convert datetime to Julian day
-        jd = swe.julday(birth_datetime.year, birth_datetime.month, birth_datetime.day,
-                       birth_datetime.hour + birth_datetime.minute/60.0)
+        jd = _quantize_jd(self._julday_fast(birth_datetime))
         
-        # Calculate planetary positions
-        planets = {}
-        for planet_name, planet_id in self.PLANETS.items():
-            position = self._calculate_planet_position(jd, planet_id)
-            planets[planet_name] = position
+        # Calculate planetary positions into one record per planet
+        planets_arr = self._calc_all(jd)
+        longitudes = planets_arr['longitude']
         
         # Calculate houses using Placidus system
-        houses, ascmc = swe.houses(jd, latitude, longitude, b'P')
+        houses, ascmc = _houses_raw(jd, lat_q, lon_q)
         
-        # Assign houses to planets
-        for planet_name, planet_pos in planets.items():
-            planet_pos.house = self._find_house(planet_pos.longitude, houses)
-            planet_pos.sign = self._find_sign(planet_pos.longitude)
-            planet_pos.degree_in_sign = planet_pos.longitude % 30
+        # Assign houses and signs to all planets in a single vectorized pass
+        planets_arr['house'] = self._assign_houses_vec(
+            np.ascontiguousarray(longitudes), np.ascontiguousarray(houses, dtype=np.float64)
+        )
+        planets_arr['longitude_arcsec'] = longitudes * 3600.0
+        planets_arr['sign_id'] = planets_arr['longitude_arcsec'] // ARCSEC_PER_SIGN
+        planets_arr['deg_in_sign'] = longitudes % 30
+        planets_arr.flags.writeable = False
         
         return BirthChart(
             datetime=birth_datetime,
             latitude=latitude,
             longitude=longitude,
-            planets=planets,
+            planet_names=self._names,
+            planets_arr=planets_arr,
             houses=list(houses),
             ascendant=ascmc[0],
             midheaven=ascmc[1]
         )
     
-    def _calculate_planet_position(self, jd: float, planet_id: int) -> PlanetPosition:
-        """Calculate precise position for single planet"""
-        result, flag = swe.calc_ut(jd, planet_id)
+    @staticmethod
+    def _julday_fast(dt: datetime) -> float:
+        """Gregorian date to Julian day (UT) without a Swiss Ephemeris call
         
-        return PlanetPosition(
-            longitude=result[0],
-            latitude=result[1],
-            distance=result[2],
-            speed=result[3]
-        )
+        Fliegel-Van Flandern day number; agrees with ``swe.julday`` once
+        quantized with ``_quantize_jd``.
+        """
+        a = (14 - dt.month) // 12
+        y = dt.year + 4800 - a
+        m = dt.month + 12 * a - 3
+        jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+        return jdn - 0.5 + (dt.hour + dt.minute / 60.0) / 24.0
+    
+    def _calc_all(self, jd: float) -> np.ndarray:
+        """Calculate positions for all planets into a PLANET_DTYPE array"""
+        planets_arr = np.zeros(len(self._ids), dtype=PLANET_DTYPE)
+        
+        jd_q = _quantize_jd(jd)
+        for i, planet_id in enumerate(self._ids.tolist()):
+            self._fill_planet_row(jd_q, planet_id, planets_arr[i])
+        
+        return planets_arr
+    
+    @staticmethod
+    def _fill_planet_row(jd: float, planet_id: int, out_row: np.void):
+        """Write one planet's ephemeris position into a PLANET_DTYPE record"""
+        (out_row['longitude'], out_row['latitude'],
+         out_row['distance'], out_row['speed']) = _calc_planet_raw(jd, planet_id)
     
     def _find_house(self, longitude: float, houses: List[float]) -> int:
         """Determine which house a longitude falls into"""
-        for i in range(12):
-            house_start = houses[i]
-            house_end = houses[(i + 1) % 12]
-            
-            # Handle crossing 0° Aries
-            if house_start > house_end:
-                if longitude >= house_start or longitude < house_end:
-                    return i + 1
-            else:
-                if house_start <= longitude < house_end:
-                    return i + 1
+        houses = np.ascontiguousarray(houses, dtype=np.float64)
+        if _NUMBA_AVAILABLE:
+            return int(_find_house_nb(float(longitude), houses))
         
-        return 1  # Default to first house
+        house = self._assign_houses_vec(np.array([longitude], dtype=np.float64), houses)
+        return int(house[0])
     
-    def _find_sign(self, longitude: float) -> str:
-        """Determine zodiac sign from longitude"""
-        sign_index = int(longitude // 30)
-        return self.SIGNS[sign_index]
+    def _assign_houses_vec(self, longitudes: np.ndarray, houses: np.ndarray) -> np.ndarray:
+        """Determine house numbers (1-12) for an array of longitudes
+        
+        Cusps are rotated so the first house cusp sits at 0°, which makes them
+        monotonic and removes the 0° Aries wraparound special case.
+        """
+        if _NUMBA_AVAILABLE:
+            return _assign_houses_nb(longitudes, houses)
+        
+        rel_cusps = (houses - houses[0]) % 360.0
+        rel_longitudes = (longitudes - houses[0]) % 360.0
+        house_numbers = np.searchsorted(rel_cusps, rel_longitudes, side='right')
+        return np.clip(house_numbers, 1, 12)
+    
+    def _find_sign(self, longitude: float) -> int:
+        """Determine zodiac sign id (index into SIGNS) from longitude"""
+        return int(longitude * 3600.0) // ARCSEC_PER_SIGN
     
     def get_planetary_aspects(self, chart: BirthChart, orb: float = 8.0) -> List[Dict]:
         """Calculate aspects between planets
@@ -136,37 +435,62 @@ class ChartCalculator:
         Returns:
             List of aspect dictionaries
         """
-        aspects = []
-        major_aspects = {
-            'conjunction': 0,
-            'sextile': 60,
-            'square': 90,
-            'trine': 120,
-            'opposition': 180
-        }
-        
-        planet_names = list(chart.planets.keys())
-        
-        for i, planet1 in enumerate(planet_names):
-            for planet2 in planet_names[i+1:]:
-                angle = abs(chart.planets[planet1].longitude - chart.planets[planet2].longitude)
-                if angle > 180:
-                    angle = 360 - angle
-                
-                for aspect_name, aspect_angle in major_aspects.items():
-                    if abs(angle - aspect_angle) <= orb:
-                        aspects.append({
-                            'planet1': planet1,
-                            'planet2': planet2,
-                            'aspect': aspect_name,
-                            'angle': angle,
-                            'orb': abs(angle - aspect_angle),
-                            'exact_angle': aspect_angle
-                        })
-                        break
-        
-        return aspects
+        aspect_names = self._aspect_names
+        aspect_angles = self._aspect_angles
+        
+        planet_names = chart.planet_names
+        longs = np.ascontiguousarray(chart.longitudes, dtype=np.float64)
+        
+        if _NUMBA_AVAILABLE:
+            pairs, angles, orbs = _aspects_nb(longs, self._targets, float(orb))
+        else:
+            pairs, angles, orbs = _aspects_np(longs, self._targets, orb, self._pair_i, self._pair_j)
+        
+        return [
+            {
+                'planet1': planet_names[i],
+                'planet2': planet_names[j],
+                'aspect': aspect_names[k],
+                'angle': angle,
+                'orb': aspect_orb,
+                'exact_angle': aspect_angles[k]
+            }
+            for (i, j, k), angle, aspect_orb in zip(pairs.tolist(), angles.tolist(), orbs.tolist())
+        ]
+    
+    @staticmethod
+    def clear_cache():
+        """Drop memoized Swiss Ephemeris results shared by all calculators"""
+        _calc_planet_raw.cache_clear()
+        _houses_raw.cache_clear()
+    
+    @classmethod
+    def configure_ephe(cls, path: str):
+        """Point Swiss Ephemeris at an ephemeris directory for the whole process
+        
+        Changing the path drops cached positions computed from the old files.
+        """
+        if cls._ephe_initialized and path == cls._ephe_path:
+            return
+        
+        swe.set_ephe_path(path)
+        if cls._ephe_path is not None and path != cls._ephe_path:
+            cls.clear_cache()
+        ChartCalculator._ephe_path = path
+        ChartCalculator._ephe_initialized = True
+    
+    @classmethod
+    def teardown(cls):
+        """Release Swiss Ephemeris resources shared by all calculators
+        
+        The next ChartCalculator reinitializes the ephemeris path.
+        """
+        swe.close()
+        ChartCalculator._ephe_initialized = False
     
     def close(self):
-        """Clean up Swiss Ephemeris resources"""
-        swe.close()
\ No newline at end of file
+        """Release this calculator
+        
+        Ephemeris state is shared across instances and is left open; use
+        ``ChartCalculator.teardown()`` to close it explicitly.
+        """
\ No newline at end of file
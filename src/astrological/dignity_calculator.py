@@ -1,21 +1,34 @@
 """Traditional astrological dignity calculations"""
 
 import numpy as np
-from typing import Dict, List
-from .chart_calculator import BirthChart
+from typing import Dict, List, Union
+from .chart_calculator import BirthChart, ChartCalculator
+
+# Integer ids used to index the dense dignity tables
+PLANET_IDS = {
+    'sun': 0, 'moon': 1, 'mercury': 2, 'venus': 3,
+    'mars': 4, 'jupiter': 5, 'saturn': 6
+}
+TRADITIONAL_PLANETS = ('sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn')
+SIGN_IDS = {sign: i for i, sign in enumerate(ChartCalculator.SIGNS)}
+
+# Elements cycle fire, earth, air, water through the zodiac from Aries
+ELEMENTS = ('fire', 'earth', 'air', 'water')
+
+DIGNITY_COMPONENTS = ('domicile', 'exaltation', 'triplicity', 'term', 'face', 'detriment', 'fall')
 
 class DignityCalculator:
     """Calculate traditional astrological dignities and strengths"""
     
-    # Traditional rulerships
+    # Traditional rulerships; frozensets so membership tests hash
     DOMICILES = {
-        'sun': ['Leo'],
-        'moon': ['Cancer'],
-        'mercury': ['Gemini', 'Virgo'],
-        'venus': ['Taurus', 'Libra'],
-        'mars': ['Aries', 'Scorpio'],
-        'jupiter': ['Sagittarius', 'Pisces'],
-        'saturn': ['Capricorn', 'Aquarius']
+        'sun': frozenset({'Leo'}),
+        'moon': frozenset({'Cancer'}),
+        'mercury': frozenset({'Gemini', 'Virgo'}),
+        'venus': frozenset({'Taurus', 'Libra'}),
+        'mars': frozenset({'Aries', 'Scorpio'}),
+        'jupiter': frozenset({'Sagittarius', 'Pisces'}),
+        'saturn': frozenset({'Capricorn', 'Aquarius'})
     }
     
     EXALTATIONS = {
@@ -29,13 +42,13 @@ class DignityCalculator:
     }
     
     DETRIMENTS = {
-        'sun': ['Aquarius'],
-        'moon': ['Capricorn'],
-        'mercury': ['Sagittarius', 'Pisces'],
-        'venus': ['Scorpio', 'Aries'],
-        'mars': ['Libra', 'Taurus'],
-        'jupiter': ['Gemini', 'Virgo'],
-        'saturn': ['Cancer', 'Leo']
+        'sun': frozenset({'Aquarius'}),
+        'moon': frozenset({'Capricorn'}),
+        'mercury': frozenset({'Sagittarius', 'Pisces'}),
+        'venus': frozenset({'Scorpio', 'Aries'}),
+        'mars': frozenset({'Libra', 'Taurus'}),
+        'jupiter': frozenset({'Gemini', 'Virgo'}),
+        'saturn': frozenset({'Cancer', 'Leo'})
     }
     
     FALLS = {
@@ -63,64 +76,70 @@ class DignityCalculator:
         'Cancer': 'water', 'Scorpio': 'water', 'Pisces': 'water'
     }
     
-    def calculate_dignity_score(self, chart: BirthChart, planet: str) -> Dict[str, float]:
+    def __init__(self):
+        """Precompute dense (component, planet, sign) dignity score tables"""
+        component_index = {name: i for i, name in enumerate(DIGNITY_COMPONENTS)}
+        table = np.zeros((len(DIGNITY_COMPONENTS), len(PLANET_IDS), len(SIGN_IDS)), dtype=np.int8)
+        
+        for planet, pid in PLANET_IDS.items():
+            for sign in self.DOMICILES[planet]:
+                table[component_index['domicile'], pid, SIGN_IDS[sign]] = 5
+            table[component_index['exaltation'], pid, SIGN_IDS[self.EXALTATIONS[planet]]] = 4
+            for sign in self.DETRIMENTS[planet]:
+                table[component_index['detriment'], pid, SIGN_IDS[sign]] = -5
+            table[component_index['fall'], pid, SIGN_IDS[self.FALLS[planet]]] = -4
+        
+        # Simplified: assume day chart for now
+        self._element_of_sign = np.tile(np.arange(len(ELEMENTS), dtype=np.int8), 3)
+        self._trip_day = np.array(
+            [PLANET_IDS[self.TRIPLICITIES[element]['day']] for element in ELEMENTS], dtype=np.int8
+        )
+        table[component_index['triplicity'], self._trip_day[self._element_of_sign], np.arange(len(SIGN_IDS))] = 3
+        
+        self._component_table = table
+        self._dignity_table = table.sum(axis=0, dtype=np.int8)
+        
+        # Modern planets carry no traditional dignity, so only these are scored
+        chart_planets = [name for name, _ in ChartCalculator.PLANETS]
+        self._trad_ids = np.array([PLANET_IDS[p] for p in TRADITIONAL_PLANETS], dtype=np.int8)
+        self._trad_chart_idx = np.array([chart_planets.index(p) for p in TRADITIONAL_PLANETS], dtype=np.int8)
+    
+    def calculate_dignity_score(self, chart: BirthChart, planet: str,
+                                _total_only: bool = False) -> Union[Dict[str, float], int]:
         """Calculate comprehensive dignity score for a planet
         
         Args:
             chart: Birth chart
             planet: Planet name
+            _total_only: Return only the total score, skipping the breakdown dict
             
         Returns:
             Dictionary with dignity breakdown and total score
         """
-        if planet not in chart.planets:
+        planets = chart.planets
+        if planet not in planets:
             raise ValueError(f"Planet {planet} not found in chart")
         
-        planet_pos = chart.planets[planet]
-        sign = planet_pos.sign
-        
-        scores = {
-            'domicile': 0,
-            'exaltation': 0,
-            'triplicity': 0,
-            'term': 0,  # Simplified for now
-            'face': 0,   # Simplified for now
-            'detriment': 0,
-            'fall': 0
-        }
-        
-        # Check domicile (+5 points)
-        if planet in self.DOMICILES and sign in self.DOMICILES[planet]:
-            scores['domicile'] = 5
-        
-        # Check exaltation (+4 points)
-        if planet in self.EXALTATIONS and sign == self.EXALTATIONS[planet]:
-            scores['exaltation'] = 4
+        planet_pos = planets[planet]
         
-        # Check detriment (-5 points)
-        if planet in self.DETRIMENTS and sign in self.DETRIMENTS[planet]:
-            scores['detriment'] = -5
+        pid = PLANET_IDS.get(planet)
+        sid = planet_pos.sign_id
         
-        # Check fall (-4 points)
-        if planet in self.FALLS and sign == self.FALLS[planet]:
-            scores['fall'] = -4
+        if _total_only:
+            return 0 if pid is None or sid is None else int(self._dignity_table[pid, sid])
         
-        # Check triplicity (+3 points)
-        if sign in self.SIGN_ELEMENTS:
-            element = self.SIGN_ELEMENTS[sign]
-            if element in self.TRIPLICITIES:
-                # Simplified: assume day chart for now
-                triplicity_ruler = self.TRIPLICITIES[element]['day']
-                if planet == triplicity_ruler:
-                    scores['triplicity'] = 3
-        
-        # Calculate total score
-        total_score = sum(scores.values())
+        if pid is None or sid is None:
+            # Modern planets and unknown signs carry no traditional dignity
+            scores = dict.fromkeys(DIGNITY_COMPONENTS, 0)
+            total_score = 0
+        else:
+            scores = dict(zip(DIGNITY_COMPONENTS, self._component_table[:, pid, sid].tolist()))
+            total_score = int(self._dignity_table[pid, sid])
         
         return {
             **scores,
             'total': total_score,
-            'sign': sign,
+            'sign': planet_pos.sign,
             'degree': planet_pos.degree_in_sign
         }
     
@@ -133,15 +152,53 @@ class DignityCalculator:
         Returns:
             Dictionary mapping planet names to dignity scores
         """
+        chart_idx, pids = self._trad_chart_idx, self._trad_ids
+        planet_names = TRADITIONAL_PLANETS
+        sids = chart.signs_idx[chart_idx]
+        
+        # One gather for every component and total across all planets
+        components = self._component_table[:, pids, sids].T.tolist()
+        totals = self._dignity_table[pids, sids].tolist()
+        signs = [ChartCalculator.SIGNS[sid] for sid in sids.tolist()]
+        degrees = chart.planets_arr['deg_in_sign'][chart_idx].tolist()
+        
         dignities = {}
+        for planet_name, planet_components, total_score, sign, degree in zip(
+                planet_names, components, totals, signs, degrees):
+            dignities[planet_name] = {
+                **dict(zip(DIGNITY_COMPONENTS, planet_components)),
+                'total': total_score,
+                'sign': sign,
+                'degree': degree
+            }
+        
+        return dignities
+    
+    def traditional_sign_ids(self, chart: BirthChart) -> np.ndarray:
+        """Sign ids of a chart's traditional planets, ordered as PLANET_IDS
         
-        for planet_name in chart.planets.keys():
-            if planet_name in ['uranus', 'neptune', 'pluto']:
-                continue  # Skip modern planets for traditional dignity
+        Stacking these for N charts gives the input calculate_batch expects.
+        """
+        sids = np.empty(len(PLANET_IDS), dtype=np.intp)
+        sids[self._trad_ids] = chart.signs_idx[self._trad_chart_idx]
+        return sids
+    
+    def calculate_batch(self, signs_idx: np.ndarray) -> np.ndarray:
+        """Calculate total dignity scores for many charts at once
+        
+        Args:
+            signs_idx: (N, 7) array of sign ids for the seven traditional
+                planets (ordered as PLANET_IDS) across N charts
             
-            dignities[planet_name] = self.calculate_dignity_score(chart, planet_name)
+        Returns:
+            (N, 7) int8 array of total dignity scores
+        """
+        signs_idx = np.asarray(signs_idx, dtype=np.intp)
+        if signs_idx.ndim != 2 or signs_idx.shape[1] != len(PLANET_IDS):
+            raise ValueError(f"Expected sign ids of shape (N, {len(PLANET_IDS)}), got {signs_idx.shape}")
         
-        return dignities
+        planet_ids = np.arange(len(PLANET_IDS))[None, :]
+        return self._dignity_table[planet_ids, signs_idx]
     
     def calculate_chart_strength(self, chart: BirthChart) -> float:
         """Calculate overall chart strength based on dignities
@@ -152,13 +209,19 @@ class DignityCalculator:
         Returns:
             Total strength score for the chart
         """
-        dignities = self.calculate_all_dignities(chart)
-        
-        total_strength = sum(
-            dignity_info['total'] for dignity_info in dignities.values()
-        )
+        return self.chart_strength_fast(chart)
+    
+    def chart_strength_fast(self, chart: BirthChart) -> int:
+        """Sum traditional dignity totals straight from the score table
         
-        return total_strength
+        Args:
+            chart: Birth chart
+            
+        Returns:
+            Total strength score for the chart
+        """
+        sids = chart.signs_idx[self._trad_chart_idx]
+        return int(self._dignity_table[self._trad_ids, sids].sum())
     
     def get_strongest_planets(self, chart: BirthChart, n: int = 3) -> List[Dict]:
         """Get the strongest planets by dignity
@@ -170,21 +233,25 @@ class DignityCalculator:
         Returns:
             List of dictionaries with planet name and strength info
         """
-        dignities = self.calculate_all_dignities(chart)
+        sids = chart.signs_idx[self._trad_chart_idx]
+        scores = self._dignity_table[self._trad_ids, sids].astype(np.int64)
         
-        # Sort by total score
-        sorted_planets = sorted(
-            [(planet, info) for planet, info in dignities.items()],
-            key=lambda x: x[1]['total'],
-            reverse=True
-        )
+        # Unique keys that order ties the way a stable descending sort would
+        n_trad = len(TRADITIONAL_PLANETS)
+        keys = scores * n_trad + np.arange(n_trad - 1, -1, -1)
+        if 0 < n < n_trad:
+            top_idx = np.argpartition(-keys, n - 1)[:n]
+            top_idx = top_idx[np.argsort(-keys[top_idx])]
+        else:
+            top_idx = np.argsort(-keys)[:n]
         
+        degrees = chart.planets_arr['deg_in_sign'][self._trad_chart_idx]
         return [
             {
-                'planet': planet,
-                'total_score': info['total'],
-                'sign': info['sign'],
-                'degree': info['degree']
+                'planet': TRADITIONAL_PLANETS[i],
+                'total_score': int(scores[i]),
+                'sign': ChartCalculator.SIGNS[sids[i]],
+                'degree': float(degrees[i])
             }
-            for planet, info in sorted_planets[:n]
-        ]
\ No newline at end of file
+            for i in top_idx.tolist()
+        ]
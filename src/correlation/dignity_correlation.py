@@ -1,14 +1,156 @@
 """Traditional Dignity Correlation Analysis"""
 
 import numpy as np
-from scipy.stats import pearsonr, spearmanr
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from scipy.stats import norm, rankdata, t as t_dist
+from typing import Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass, replace
 
 from ..astrological.chart_calculator import BirthChart
 from ..astrological.dignity_calculator import DignityCalculator
 from ..genetic.variant_analyzer import GeneticProfile
-from ..genetic.polygenic_calculator import PolygenicCalculator
+from ..genetic.polygenic_calculator import PolygenicCalculator, PolygenicRiskScore
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    _NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels below remain plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Traditional planetary rulerships for genetic traits
+_PLANETARY_TRAITS: Dict[str, Tuple[str, ...]] = {
+    'sun': ('cardiovascular_disease', 'vitality'),
+    'moon': ('emotional_regulation', 'circadian'),
+    'mercury': ('cognitive_ability', 'nervous_system'),
+    'venus': ('metabolic_efficiency', 'hormonal'),
+    'mars': ('inflammatory_response', 'athletic_performance'),
+    'jupiter': ('growth', 'liver_function'),
+    'saturn': ('structural', 'aging')
+}
+_TRAIT_PLANETS: Tuple[str, ...] = tuple(_PLANETARY_TRAITS)
+
+def _fast_spearman(x, y) -> Tuple[float, float]:
+    """Spearman correlation and two-sided p-value for short vectors
+    
+    Same statistic as ``spearmanr`` (Pearson on average ranks, Student-t
+    p-value with n - 2 degrees of freedom) without its input validation
+    overhead. Constant input gives ``(nan, nan)``.
+    """
+    rank_x = rankdata(x)
+    rank_y = rankdata(y)
+    dev_x = rank_x - rank_x.mean()
+    dev_y = rank_y - rank_y.mean()
+    
+    denom = np.sqrt((dev_x @ dev_x) * (dev_y @ dev_y))
+    if denom == 0:
+        return np.nan, np.nan
+    rho = np.clip((dev_x @ dev_y) / denom, -1.0, 1.0)
+    
+    dof = len(rank_x) - 2
+    with np.errstate(divide='ignore'):
+        t_stat = rho * np.sqrt(dof / ((1.0 + rho) * (1.0 - rho)))
+    p_value = 2 * t_dist.sf(np.abs(t_stat), dof)
+    return rho, p_value
+
+def _resampled_ranks_np(groups: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Average ranks within each resampled row from precomputed tie groups
+    
+    Args:
+        groups: (n,) dense 0-based rank of each observation (equal values share a group)
+        indices: (n_bootstrap, n) resample indices
+        
+    Returns:
+        (n_bootstrap, n) ranks matching rankdata applied to every resampled row
+    """
+    n_bootstrap = indices.shape[0]
+    n_groups = int(groups.max()) + 1
+    drawn = groups[indices]
+    
+    # Draws per tie group in each replicate; a group's members share the midpoint of its rank span
+    offsets = np.arange(n_bootstrap)[:, None] * n_groups
+    group_counts = np.bincount((drawn + offsets).ravel(), minlength=n_bootstrap * n_groups)
+    group_counts = group_counts.reshape(n_bootstrap, n_groups)
+    midranks = np.cumsum(group_counts, axis=1) - group_counts + (group_counts + 1) / 2.0
+    return np.take_along_axis(midranks, drawn, axis=1)
+
+def _bootstrap_spearman_np(groups_x: np.ndarray, groups_y: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Spearman correlation of every resampled row of ``indices`` (NaN if constant)"""
+    # Spearman per replicate: Pearson correlation of within-row ranks
+    rank_x = _resampled_ranks_np(groups_x, indices)
+    rank_y = _resampled_ranks_np(groups_y, indices)
+    dev_x = rank_x - rank_x.mean(axis=1, keepdims=True)
+    dev_y = rank_y - rank_y.mean(axis=1, keepdims=True)
+    cov = (dev_x * dev_y).sum(axis=1)
+    var_x = (dev_x * dev_x).sum(axis=1)
+    var_y = (dev_y * dev_y).sum(axis=1)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return cov / np.sqrt(var_x * var_y)
+
+# Compiled on the first bootstrap and deliberately not cached on disk, since
+# a cached kernel only loads under the module name it was compiled with.
+@njit()
+def _resampled_ranks_nb(groups, n_groups, row):
+    """Average ranks of one resampled row from precomputed tie groups"""
+    counts = np.zeros(n_groups, dtype=np.float64)
+    for k in range(row.shape[0]):
+        counts[groups[row[k]]] += 1.0
+    
+    midranks = np.empty(n_groups, dtype=np.float64)
+    below = 0.0
+    for g in range(n_groups):
+        midranks[g] = below + (counts[g] + 1.0) / 2.0
+        below += counts[g]
+    
+    ranks = np.empty(row.shape[0], dtype=np.float64)
+    for k in range(row.shape[0]):
+        ranks[k] = midranks[groups[row[k]]]
+    return ranks
+
+@njit(parallel=True)
+def _bootstrap_spearman_nb(groups_x, groups_y, indices):
+    """Parallel equivalent of _bootstrap_spearman_np, one replicate per prange step"""
+    n_bootstrap = indices.shape[0]
+    n_groups_x = groups_x.max() + 1
+    n_groups_y = groups_y.max() + 1
+    correlations = np.empty(n_bootstrap, dtype=np.float64)
+    
+    for b in prange(n_bootstrap):
+        dev_x = _resampled_ranks_nb(groups_x, n_groups_x, indices[b])
+        dev_y = _resampled_ranks_nb(groups_y, n_groups_y, indices[b])
+        dev_x -= dev_x.mean()
+        dev_y -= dev_y.mean()
+        
+        denom = np.sqrt((dev_x * dev_x).sum() * (dev_y * dev_y).sum())
+        if denom == 0.0:
+            correlations[b] = np.nan
+        else:
+            correlations[b] = (dev_x * dev_y).sum() / denom
+    
+    return correlations
+
+@dataclass
+class PlanetaryVector:
+    """Per-planet dignity and genetic scores as parallel arrays"""
+    planets: Tuple[str, ...]
+    dignity: np.ndarray
+    genetic: np.ndarray
+    
+    @classmethod
+    def from_scores(cls, dignity_scores: Dict[str, Dict], genetic_impact: Dict[str, float]) -> 'PlanetaryVector':
+        """Align dignity totals and genetic impacts on the planets both cover"""
+        planets = tuple(planet for planet in dignity_scores if planet in genetic_impact)
+        return cls(
+            planets=planets,
+            dignity=np.array([dignity_scores[planet]['total'] for planet in planets], dtype=np.float64),
+            genetic=np.array([genetic_impact[planet] for planet in planets], dtype=np.float64)
+        )
 
 @dataclass
 class DignityCorrelationResult:
@@ -25,10 +167,66 @@ class DignityCorrelationResult:
 class DignityCorrelation:
     """Correlate traditional astrological dignities with genetic effect sizes"""
     
+    # Charts/profiles are treated as immutable once analyzed; results for the
+    # most recent ones are reused across analyses. The caches hold references
+    # to those charts and profiles until evicted or clear_cache is called.
+    CACHE_SIZE = 128
+    
     def __init__(self):
         """Initialize dignity correlation analyzer"""
         self.dignity_calc = DignityCalculator()
         self.polygenic_calc = PolygenicCalculator()
+        self._dignity_cache: Dict[int, Tuple[BirthChart, Dict]] = {}
+        self._impact_cache: Dict[int, Tuple[GeneticProfile, Dict[str, float]]] = {}
+        self._prs_cache: Dict[int, Tuple[GeneticProfile, Dict[str, PolygenicRiskScore]]] = {}
+        self._rng = np.random.default_rng()
+    
+    def clear_cache(self):
+        """Forget cached dignity, PRS and genetic impact scores"""
+        self._dignity_cache.clear()
+        self._impact_cache.clear()
+        self._prs_cache.clear()
+    
+    def _cached(self, cache: Dict, obj, compute):
+        """Look up ``compute(obj)`` in an identity-keyed cache
+        
+        The object is stored alongside its result so its id cannot be
+        reused while the entry is alive.
+        """
+        entry = cache.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        
+        value = compute(obj)
+        if len(cache) >= self.CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[id(obj)] = (obj, value)
+        return value
+    
+    def calculate_dignities(self, chart: BirthChart) -> Dict[str, Dict]:
+        """Dignity scores of a chart (cached DignityCalculator.calculate_all_dignities)
+        
+        Results are cached per chart object, so other analyses of the same
+        chart can reuse them; call clear_cache after mutating a chart. The
+        cache keeps a reference to the chart, and the returned dicts are
+        copies that can be modified without affecting it.
+        """
+        return {planet: dict(scores) for planet, scores in self._dignities(chart).items()}
+    
+    def calculate_prs(self, profile: GeneticProfile) -> Dict[str, PolygenicRiskScore]:
+        """Polygenic risk scores of a profile (cached PolygenicCalculator.calculate_all_prs)
+        
+        Like calculate_dignities, this returns copies of the cached scores.
+        """
+        return {trait: replace(score) for trait, score in self._prs_scores(profile).items()}
+    
+    def _dignities(self, chart: BirthChart) -> Dict[str, Dict]:
+        """Cached dignity scores shared by the analyses (not to be modified)"""
+        return self._cached(self._dignity_cache, chart, self.dignity_calc.calculate_all_dignities)
+    
+    def _prs_scores(self, profile: GeneticProfile) -> Dict[str, PolygenicRiskScore]:
+        """Cached PRS scores shared by the analyses (not to be modified)"""
+        return self._cached(self._prs_cache, profile, self.polygenic_calc.calculate_all_prs)
     
     def analyze_dignity_genetic_correlation(self, chart: BirthChart, profile: GeneticProfile) -> DignityCorrelationResult:
         """Analyze correlation between traditional dignities and genetic effects
@@ -41,43 +239,62 @@ class DignityCorrelation:
             Correlation analysis results
         """
         # Calculate dignity scores for all planets
-        dignity_scores = self.dignity_calc.calculate_all_dignities(chart)
+        dignity_scores = self._dignities(chart)
         
         # Calculate genetic impact scores
         genetic_impact = self._calculate_weighted_genetic_impact(profile)
         
-        # Prepare data for correlation
-        dignity_values = []
-        genetic_values = []
-        planet_names = []
+        return self._build_correlation_result(dignity_scores, genetic_impact)
+    
+    def analyze_all(self, chart: BirthChart,
+                    profile: GeneticProfile) -> Tuple[DignityCorrelationResult, Dict[str, Dict]]:
+        """Run the correlation and the planetary mapping analyses together
+        
+        Dignity and genetic impact scores are computed once and shared.
         
-        for planet in dignity_scores.keys():
-            if planet in genetic_impact:
-                dignity_values.append(dignity_scores[planet]['total'])
-                genetic_values.append(genetic_impact[planet])
-                planet_names.append(planet)
+        Args:
+            chart: Birth chart
+            profile: Genetic profile
+            
+        Returns:
+            Tuple of (correlation analysis results, detailed mapping analysis)
+        """
+        dignity_scores = self._dignities(chart)
+        genetic_impact = self._calculate_weighted_genetic_impact(profile)
         
-        if len(dignity_values) < 3:
+        return (
+            self._build_correlation_result(dignity_scores, genetic_impact),
+            self._build_mapping_analysis(dignity_scores, genetic_impact)
+        )
+    
+    def _build_correlation_result(self, dignity_scores: Dict[str, Dict],
+                                  genetic_impact: Dict[str, float]) -> DignityCorrelationResult:
+        """Correlate precomputed dignity and genetic impact scores"""
+        # Prepare data for correlation
+        vector = PlanetaryVector.from_scores(dignity_scores, genetic_impact)
+        planet_names = vector.planets
+        
+        if len(planet_names) < 3:
             raise ValueError("Insufficient data for correlation analysis")
         
         # Calculate correlation
-        correlation, p_value = spearmanr(dignity_values, genetic_values)
+        correlation, p_value = _fast_spearman(vector.dignity, vector.genetic)
         
         # Calculate confidence interval (bootstrap method)
         ci_lower, ci_upper = self._bootstrap_confidence_interval(
-            dignity_values, genetic_values, correlation
+            vector.dignity, vector.genetic, correlation
         )
         
         # Identify significant individual correlations
         significant_correlations = self._find_significant_individual_correlations(
-            dignity_scores, genetic_impact
+            dignity_scores, genetic_impact, vector=vector
         )
         
         return DignityCorrelationResult(
             correlation_coefficient=correlation,
             p_value=p_value,
             confidence_interval=(ci_lower, ci_upper),
-            sample_size=len(dignity_values),
+            sample_size=len(planet_names),
             method="Spearman",
             dignity_scores={planet: dignity_scores[planet]['total'] for planet in planet_names},
             genetic_scores={planet: genetic_impact[planet] for planet in planet_names},
@@ -86,97 +303,146 @@ class DignityCorrelation:
     
     def _calculate_weighted_genetic_impact(self, profile: GeneticProfile) -> Dict[str, float]:
         """Calculate weighted genetic impact scores mapped to planetary rulerships"""
-        impact_scores = {}
-        
-        # Traditional planetary rulerships for genetic traits
-        planetary_traits = {
-            'sun': ['cardiovascular_disease', 'vitality'],
-            'moon': ['emotional_regulation', 'circadian'],
-            'mercury': ['cognitive_ability', 'nervous_system'],
-            'venus': ['metabolic_efficiency', 'hormonal'],
-            'mars': ['inflammatory_response', 'athletic_performance'],
-            'jupiter': ['growth', 'liver_function'],
-            'saturn': ['structural', 'aging']
-        }
+        return self._cached(self._impact_cache, profile, self._compute_weighted_genetic_impact)
+    
+    def _compute_weighted_genetic_impact(self, profile: GeneticProfile) -> Dict[str, float]:
+        """Uncached body of _calculate_weighted_genetic_impact"""
+        planets = _TRAIT_PLANETS
         
         # Calculate PRS scores for available traits
-        prs_scores = self.polygenic_calc.calculate_all_prs(profile)
+        prs_scores = self._prs_scores(profile)
         
-        for planet, traits in planetary_traits.items():
-            planet_score = 0.0
-            trait_count = 0
-            
-            for trait in traits:
-                if trait in prs_scores:
-                    # Convert percentile to z-score for better correlation
-                    percentile = prs_scores[trait].percentile
-                    z_score = self._percentile_to_zscore(percentile)
-                    planet_score += z_score * prs_scores[trait].confidence
-                    trait_count += 1
+        scored = [
+            (planet_idx, prs_scores[trait])
+            for planet_idx, traits in enumerate(_PLANETARY_TRAITS.values())
+            for trait in traits
+            if trait in prs_scores
+        ]
+        
+        planet_scores = np.zeros(len(planets))
+        trait_counts = np.zeros(len(planets), dtype=np.int64)
+        if scored:
+            planet_idx = np.array([idx for idx, _ in scored], dtype=np.intp)
+            percentiles = np.array([prs.percentile for _, prs in scored], dtype=np.float64)
+            confidences = np.array([prs.confidence for _, prs in scored], dtype=np.float64)
             
-            if trait_count > 0:
-                impact_scores[planet] = planet_score / trait_count
-            else:
-                impact_scores[planet] = 0.0
+            # Convert percentiles to z-scores for better correlation, in one call
+            z_scores = self._percentile_to_zscore(percentiles)
+            np.add.at(planet_scores, planet_idx, z_scores * confidences)
+            trait_counts = np.bincount(planet_idx, minlength=len(planets))
         
-        return impact_scores
+        return {
+            planet: planet_score / trait_count if trait_count > 0 else 0.0
+            for planet, planet_score, trait_count in zip(planets, planet_scores.tolist(), trait_counts.tolist())
+        }
     
-    def _percentile_to_zscore(self, percentile: float) -> float:
-        """Convert percentile to z-score"""
-        from scipy.stats import norm
-        return norm.ppf(percentile / 100.0)
+    def _percentile_to_zscore(self, percentile: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Convert percentile(s) to z-score(s)"""
+        return norm.ppf(np.divide(percentile, 100.0))
     
     def _bootstrap_confidence_interval(self, x: List[float], y: List[float], 
-                                     observed_corr: float, n_bootstrap: int = 1000) -> Tuple[float, float]:
-        """Calculate bootstrap confidence interval for correlation"""
-        correlations = []
+                                     observed_corr: float, n_bootstrap: int = 1000,
+                                     batch_size: int = 100, tolerance: float = 0.01) -> Tuple[float, float]:
+        """Calculate bootstrap confidence interval for correlation
+        
+        Replicates are drawn in batches of ``batch_size`` index rows; each row
+        is re-ranked and correlated in bulk (in parallel when numba is
+        available) instead of calling spearmanr per replicate. Sampling stops
+        early once the interval width changes by less than ``tolerance``
+        (relative) for two consecutive batches, and never exceeds
+        ``n_bootstrap`` replicates.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
         n = len(x)
         
-        for _ in range(n_bootstrap):
-            # Resample with replacement
-            indices = np.random.choice(n, size=n, replace=True)
-            x_boot = [x[i] for i in indices]
-            y_boot = [y[i] for i in indices]
+        if np.isnan(x).any() or np.isnan(y).any():
+            # Every replicate would be undefined
+            return (-1.0, 1.0)
+        
+        # Rank once: resampling only changes how many draws each tie group
+        # gets, so within-replicate ranks follow from group counts
+        groups_x = (rankdata(x, method='dense') - 1).astype(np.intp)
+        groups_y = (rankdata(y, method='dense') - 1).astype(np.intp)
+        index_dtype = np.int32 if n < 2 ** 31 else np.int64
+        
+        batches = []
+        n_valid = 0
+        previous_width = None
+        stable_batches = 0
+        
+        for start in range(0, n_bootstrap, batch_size):
+            size = min(batch_size, n_bootstrap - start)
+            indices = self._rng.integers(0, n, size=(size, n), dtype=index_dtype)
+            
+            if _NUMBA_AVAILABLE:
+                batch = _bootstrap_spearman_nb(groups_x, groups_y, indices)
+            else:
+                batch = _bootstrap_spearman_np(groups_x, groups_y, indices)
             
-            try:
-                corr, _ = spearmanr(x_boot, y_boot)
-                if not np.isnan(corr):
-                    correlations.append(corr)
-            except:
+            # Constant resamples have no defined correlation (NaN) and are
+            # dropped in one masked pass along with any other non-finite value
+            batch = batch[np.isfinite(batch)]
+            batches.append(batch)
+            n_valid += len(batch)
+            if n_valid == 0:
                 continue
+            
+            lower, upper = self._percentile_interval(np.concatenate(batches))
+            width = upper - lower
+            if previous_width is not None and abs(width - previous_width) <= tolerance * previous_width:
+                stable_batches += 1
+                if stable_batches >= 2:
+                    break
+            else:
+                stable_batches = 0
+            previous_width = width
         
-        if len(correlations) == 0:
+        if n_valid == 0:
             return (-1.0, 1.0)
         
-        # Calculate 95% confidence interval
-        correlations.sort()
+        return self._percentile_interval(np.concatenate(batches))
+    
+    @staticmethod
+    def _percentile_interval(correlations: np.ndarray) -> Tuple[float, float]:
+        """95% percentile interval of bootstrap correlations"""
+        # Only two order statistics are needed
         lower_idx = int(0.025 * len(correlations))
         upper_idx = int(0.975 * len(correlations))
+        correlations = np.partition(correlations, (lower_idx, upper_idx))
         
         return (correlations[lower_idx], correlations[upper_idx])
     
     def _find_significant_individual_correlations(self, dignity_scores: Dict, 
                                                 genetic_impact: Dict, 
-                                                alpha: float = 0.05) -> List[Dict]:
+                                                alpha: float = 0.05,
+                                                vector: Optional[PlanetaryVector] = None) -> List[Dict]:
         """Find individually significant planet-trait correlations"""
-        significant = []
-        
-        for planet in dignity_scores.keys():
-            if planet in genetic_impact:
-                dignity_score = dignity_scores[planet]['total']
-                genetic_score = genetic_impact[planet]
-                
-                # Simple significance test (would need more data points in practice)
-                if abs(dignity_score) > 2 and abs(genetic_score) > 1:
-                    significant.append({
-                        'planet': planet,
-                        'dignity_score': dignity_score,
-                        'genetic_score': genetic_score,
-                        'strength': abs(dignity_score * genetic_score),
-                        'sign': dignity_scores[planet]['sign']
-                    })
-        
-        return sorted(significant, key=lambda x: x['strength'], reverse=True)
+        if vector is None:
+            vector = PlanetaryVector.from_scores(dignity_scores, genetic_impact)
+        
+        # Simple significance test (would need more data points in practice)
+        mask = (np.abs(vector.dignity) > 2) & (np.abs(vector.genetic) > 1)
+        candidates = np.flatnonzero(mask)
+        strengths = np.abs(vector.dignity * vector.genetic)
+        # Stable sort keeps planet order among equal strengths, as sorted() did
+        order = candidates[np.argsort(-strengths[candidates], kind='stable')]
+        
+        return [
+            {
+                'planet': vector.planets[idx],
+                'dignity_score': dignity_score,
+                'genetic_score': genetic_score,
+                'strength': strength,
+                'sign': dignity_scores[vector.planets[idx]]['sign']
+            }
+            for idx, dignity_score, genetic_score, strength in zip(
+                order.tolist(),
+                vector.dignity[order].tolist(),
+                vector.genetic[order].tolist(),
+                strengths[order].tolist()
+            )
+        ]
     
     def analyze_planetary_genetic_mapping(self, chart: BirthChart, profile: GeneticProfile) -> Dict[str, Dict]:
         """Detailed analysis of planetary-genetic mappings
@@ -188,39 +454,47 @@ class DignityCorrelation:
         Returns:
             Detailed mapping analysis
         """
-        dignity_scores = self.dignity_calc.calculate_all_dignities(chart)
+        dignity_scores = self._dignities(chart)
         genetic_impact = self._calculate_weighted_genetic_impact(profile)
         
+        return self._build_mapping_analysis(dignity_scores, genetic_impact)
+    
+    def _build_mapping_analysis(self, dignity_scores: Dict[str, Dict],
+                                genetic_impact: Dict[str, float]) -> Dict[str, Dict]:
+        """Planetary mapping analysis from precomputed dignity and genetic impact scores"""
+        # Harmony scores (how well dignity matches genetic expression) for all planets at once
+        vector = PlanetaryVector.from_scores(dignity_scores, genetic_impact)
+        harmony_scores = self._calculate_harmony_score(vector.dignity, vector.genetic)
+        
         planetary_analysis = {}
         
-        for planet in dignity_scores.keys():
-            if planet in genetic_impact:
-                dignity_info = dignity_scores[planet]
-                genetic_score = genetic_impact[planet]
-                
-                # Calculate harmony score (how well dignity matches genetic expression)
-                harmony_score = self._calculate_harmony_score(dignity_info['total'], genetic_score)
-                
-                planetary_analysis[planet] = {
-                    'dignity_total': dignity_info['total'],
-                    'dignity_breakdown': {
-                        key: value for key, value in dignity_info.items() 
-                        if key not in ['total', 'sign', 'degree']
-                    },
-                    'genetic_impact': genetic_score,
-                    'harmony_score': harmony_score,
-                    'sign': dignity_info['sign'],
-                    'degree': dignity_info['degree'],
-                    'interpretation': self._interpret_planetary_correlation(
-                        planet, dignity_info['total'], genetic_score, harmony_score
-                    )
-                }
+        for planet, harmony_score in zip(vector.planets, harmony_scores.tolist()):
+            dignity_info = dignity_scores[planet]
+            genetic_score = genetic_impact[planet]
+            
+            planetary_analysis[planet] = {
+                'dignity_total': dignity_info['total'],
+                'dignity_breakdown': {
+                    key: value for key, value in dignity_info.items() 
+                    if key not in ['total', 'sign', 'degree']
+                },
+                'genetic_impact': genetic_score,
+                'harmony_score': harmony_score,
+                'sign': dignity_info['sign'],
+                'degree': dignity_info['degree'],
+                'interpretation': self._interpret_planetary_correlation(
+                    planet, dignity_info['total'], genetic_score, harmony_score
+                )
+            }
         
         return planetary_analysis
     
-    def _calculate_harmony_score(self, dignity_score: float, genetic_score: float) -> float:
+    def _calculate_harmony_score(self, dignity_score: Union[float, np.ndarray],
+                                 genetic_score: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Calculate harmony between dignity and genetic expression
         
+        Works elementwise on per-planet score arrays.
+        
         Positive harmony: Both high or both low
         Negative harmony: One high, one low
         """
@@ -1,7 +1,8 @@
 """Biological Pathway Correlation Analysis"""
 
+import math
 import numpy as np
-from scipy.stats import pearsonr, spearmanr
+from scipy.stats import rankdata, spearmanr, t as t_dist
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
@@ -10,6 +11,27 @@ from ..astrological.dignity_calculator import DignityCalculator
 from ..genetic.variant_analyzer import GeneticProfile
 from ..genetic.pathway_analyzer import PathwayAnalyzer
 
+# House strength by house number (index 0 unused): angular 1/4/7/10 = 2,
+# succedent 2/5/8/11 = 1, cadent 3/6/9/12 = 0
+_HOUSE_STRENGTH = np.array([0.0, 2.0, 1.0, 0.0, 2.0, 1.0, 0.0, 2.0, 1.0, 0.0, 2.0, 1.0, 0.0])
+
+def _rowwise_spearman(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Spearman correlation and two-sided p-value between matching rows of x and y
+    
+    Rows that are constant in either input give NaN, as spearmanr does.
+    """
+    rank_x = rankdata(x, axis=1)
+    rank_y = rankdata(y, axis=1)
+    dev_x = rank_x - rank_x.mean(axis=1, keepdims=True)
+    dev_y = rank_y - rank_y.mean(axis=1, keepdims=True)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rho = (dev_x * dev_y).sum(axis=1) / np.sqrt((dev_x * dev_x).sum(axis=1) * (dev_y * dev_y).sum(axis=1))
+        rho = np.clip(rho, -1.0, 1.0)
+        dof = x.shape[1] - 2
+        t_stat = rho * np.sqrt(dof / ((1.0 + rho) * (1.0 - rho)))
+    return rho, 2 * t_dist.sf(np.abs(t_stat), dof)
+
 @dataclass
 class PathwayCorrelationResult:
     """Results from pathway-planetary correlation analysis"""
@@ -24,10 +46,45 @@ class PathwayCorrelationResult:
 class PathwayCorrelation:
     """Test traditional planetary rulerships against biological pathway activity"""
     
+    CACHE_SIZE = 128
+    
     def __init__(self):
         """Initialize pathway correlation analyzer"""
         self.dignity_calc = DignityCalculator()
         self.pathway_analyzer = PathwayAnalyzer()
+        self._pathway_cache: Dict[int, Tuple[GeneticProfile, Dict[str, Dict]]] = {}
+        self._pathway_scores_cache: Dict[int, Tuple[GeneticProfile, Dict[str, float]]] = {}
+    
+    def clear_cache(self):
+        """Forget cached pathway analyses"""
+        self._pathway_cache.clear()
+        self._pathway_scores_cache.clear()
+    
+    def _cached(self, cache: Dict, obj, compute):
+        """Look up ``compute(obj)`` in an identity-keyed cache
+        
+        The object is stored alongside its result so its id cannot be
+        reused while the entry is alive.
+        """
+        entry = cache.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        
+        value = compute(obj)
+        if len(cache) >= self.CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[id(obj)] = (obj, value)
+        return value
+    
+    def _get_pathway_correlations(self, profile: GeneticProfile) -> Dict[str, Dict]:
+        """Cached PathwayAnalyzer.get_planetary_pathway_correlations"""
+        return self._cached(self._pathway_cache, profile,
+                            self.pathway_analyzer.get_planetary_pathway_correlations)
+    
+    def _get_pathway_scores(self, profile: GeneticProfile) -> Dict[str, float]:
+        """Cached PathwayAnalyzer.calculate_pathway_scores"""
+        return self._cached(self._pathway_scores_cache, profile,
+                            self.pathway_analyzer.calculate_pathway_scores)
     
     def analyze_planetary_pathway_correlations(self, chart: BirthChart, profile: GeneticProfile) -> PathwayCorrelationResult:
         """Analyze correlations between planetary strengths and biological pathways
@@ -43,24 +100,12 @@ class PathwayCorrelation:
         planetary_strengths = self._calculate_planetary_strengths(chart)
         
         # Get pathway scores mapped to planetary rulerships
-        pathway_correlations = self.pathway_analyzer.get_planetary_pathway_correlations(profile)
+        pathway_correlations = self._get_pathway_correlations(profile)
         
         # Analyze individual correlations
-        individual_correlations = {}
-        correlation_values = []
-        
-        for planet in planetary_strengths.keys():
-            if planet in pathway_correlations:
-                planet_strength = planetary_strengths[planet]
-                pathway_score = pathway_correlations[planet]['total_score']
-                
-                # Calculate individual correlation
-                individual_corr = self._calculate_individual_correlation(
-                    planet_strength, pathway_score, planet, pathway_correlations[planet]
-                )
-                
-                individual_correlations[planet] = individual_corr
-                correlation_values.append(individual_corr['correlation'])
+        individual_correlations = self._calculate_individual_correlations(
+            planetary_strengths, pathway_correlations
+        )
         
         # Calculate overall correlation
         planet_values = [planetary_strengths[p] for p in individual_correlations.keys()]
@@ -87,43 +132,68 @@ class PathwayCorrelation:
             confidence_level=confidence_level
         )
     
+    def overall_correlations_batch(self, charts: List[BirthChart],
+                                   profiles: List[GeneticProfile]) -> Tuple[np.ndarray, np.ndarray]:
+        """Overall planet-pathway Spearman correlation for many chart/profile pairs
+        
+        Equivalent to the ``overall_correlation``/``p_value`` fields of
+        analyze_planetary_pathway_correlations for each pair, with samples
+        that share a planet set ranked and correlated together.
+        
+        Args:
+            charts: Birth charts
+            profiles: Genetic profiles, one per chart
+            
+        Returns:
+            Tuple of (correlations, p_values) arrays, one entry per sample
+        """
+        if len(charts) != len(profiles):
+            raise ValueError("charts and profiles must have the same length")
+        
+        correlations = np.zeros(len(charts))
+        p_values = np.ones(len(charts))
+        
+        # Samples with fewer than 3 shared planets keep the 0.0 / 1.0 defaults
+        groups: Dict[Tuple[str, ...], Tuple[List[int], List[List[float]], List[List[float]]]] = {}
+        for sample_idx, (chart, profile) in enumerate(zip(charts, profiles)):
+            planetary_strengths = self._calculate_planetary_strengths(chart)
+            pathway_correlations = self._get_pathway_correlations(profile)
+            planets = tuple(p for p in planetary_strengths if p in pathway_correlations)
+            if len(planets) < 3:
+                continue
+            
+            sample_ids, planet_rows, pathway_rows = groups.setdefault(planets, ([], [], []))
+            sample_ids.append(sample_idx)
+            planet_rows.append([planetary_strengths[p] for p in planets])
+            pathway_rows.append([pathway_correlations[p]['total_score'] for p in planets])
+        
+        for sample_ids, planet_rows, pathway_rows in groups.values():
+            rho, p_value = _rowwise_spearman(np.array(planet_rows), np.array(pathway_rows))
+            correlations[sample_ids] = rho
+            p_values[sample_ids] = p_value
+        
+        return correlations, p_values
+    
     def _calculate_planetary_strengths(self, chart: BirthChart) -> Dict[str, float]:
         """Calculate comprehensive planetary strength scores"""
         dignity_scores = self.dignity_calc.calculate_all_dignities(chart)
-        planetary_strengths = {}
+        planets = list(dignity_scores)
+        chart_idx = [chart.planet_names.index(planet) for planet in planets]
         
-        for planet, dignity_info in dignity_scores.items():
-            # Base dignity score
-            base_strength = dignity_info['total']
-            
-            # Add house strength (simplified)
-            planet_pos = chart.planets[planet]
-            house_strength = self._calculate_house_strength(planet_pos.house)
-            
-            # Add aspect strength (simplified)
-            aspect_strength = self._calculate_aspect_strength(chart, planet)
-            
-            # Combined strength score
-            total_strength = base_strength + house_strength + aspect_strength
-            planetary_strengths[planet] = total_strength
-        
-        return planetary_strengths
-    
-    def _calculate_house_strength(self, house: int) -> float:
-        """Calculate strength bonus/penalty based on house position"""
-        # Angular houses (1, 4, 7, 10) are strongest
-        angular_houses = [1, 4, 7, 10]
-        succedent_houses = [2, 5, 8, 11]
-        cadent_houses = [3, 6, 9, 12]
-        
-        if house in angular_houses:
-            return 2.0
-        elif house in succedent_houses:
-            return 1.0
-        elif house in cadent_houses:
-            return 0.0
-        else:
-            return 0.0
+        # Base dignity score
+        base_strength = np.array([dignity_scores[planet]['total'] for planet in planets], dtype=np.float64)
+        
+        # Add house strength (simplified)
+        house_strength = _HOUSE_STRENGTH[chart.houses_idx[chart_idx]]
+        
+        # Add aspect strength (simplified)
+        aspect_strength = np.array(
+            [self._calculate_aspect_strength(chart, planet) for planet in planets], dtype=np.float64
+        )
+        
+        # Combined strength score
+        total_strength = base_strength + house_strength + aspect_strength
+        return dict(zip(planets, total_strength.tolist()))
     
     def _calculate_aspect_strength(self, chart: BirthChart, planet: str) -> float:
         """Calculate strength from aspects (simplified)"""
@@ -131,28 +201,38 @@ class PathwayCorrelation:
         # For now, return a neutral value
         return 0.0
     
-    def _calculate_individual_correlation(self, planet_strength: float, pathway_score: float, 
-                                        planet: str, pathway_info: Dict) -> Dict:
-        """Calculate individual planet-pathway correlation"""
+    def _calculate_individual_correlations(self, planetary_strengths: Dict[str, float],
+                                           pathway_correlations: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Calculate individual planet-pathway correlations for all matched planets"""
+        planets = [planet for planet in planetary_strengths if planet in pathway_correlations]
+        planet_strength = np.array([planetary_strengths[p] for p in planets], dtype=np.float64)
+        pathway_score = np.array([pathway_correlations[p]['total_score'] for p in planets], dtype=np.float64)
+        
         # Normalize scores for better correlation
         planet_norm = np.tanh(planet_strength / 5.0)
         pathway_norm = np.tanh(pathway_score * 2.0)
         
         # Simple correlation measure
-        correlation = planet_norm * pathway_norm
+        correlations = planet_norm * pathway_norm
         
-        # Calculate significance based on pathway data quality
-        pathway_count = pathway_info.get('pathway_count', 0)
-        significance = min(pathway_count / 3.0, 1.0)  # More pathways = higher significance
+        individual_correlations = {}
+        for planet, correlation in zip(planets, correlations.tolist()):
+            pathway_info = pathway_correlations[planet]
+            
+            # Calculate significance based on pathway data quality
+            pathway_count = pathway_info.get('pathway_count', 0)
+            significance = min(pathway_count / 3.0, 1.0)  # More pathways = higher significance
+            
+            individual_correlations[planet] = {
+                'correlation': correlation,
+                'planet_strength': planetary_strengths[planet],
+                'pathway_score': pathway_info['total_score'],
+                'significance': significance,
+                'pathway_details': pathway_info['pathway_scores'],
+                'interpretation': self._interpret_correlation(planet, correlation, significance)
+            }
         
-        return {
-            'correlation': correlation,
-            'planet_strength': planet_strength,
-            'pathway_score': pathway_score,
-            'significance': significance,
-            'pathway_details': pathway_info['pathway_scores'],
-            'interpretation': self._interpret_correlation(planet, correlation, significance)
-        }
+        return individual_correlations
     
     def _interpret_correlation(self, planet: str, correlation: float, significance: float) -> str:
         """Generate interpretation of planet-pathway correlation"""
@@ -189,15 +269,18 @@ class PathwayCorrelation:
         variant_confidence = min(variant_count / 20.0, 1.0)  # 20+ variants = full confidence
         
         # Average correlation strength
-        correlations = [corr_info['correlation'] for corr_info in individual_correlations.values()]
-        if correlations:
-            avg_correlation_strength = np.mean([abs(c) for c in correlations])
+        correlations = np.fromiter(
+            (corr_info['correlation'] for corr_info in individual_correlations.values()),
+            dtype=np.float64, count=len(individual_correlations)
+        )
+        if correlations.size:
+            avg_correlation_strength = float(np.abs(correlations).mean())
         else:
             avg_correlation_strength = 0.0
         
         # Consistency (low standard deviation = high consistency)
-        if len(correlations) > 1:
-            consistency = 1.0 - min(np.std(correlations), 1.0)
+        if correlations.size > 1:
+            consistency = 1.0 - min(float(correlations.std()), 1.0)
         else:
             consistency = 0.5
         
@@ -227,12 +310,12 @@ class PathwayCorrelation:
         planet_strength = planetary_strengths.get(planet, 0.0)
         
         # Get pathway scores
-        pathway_scores = self.pathway_analyzer.calculate_pathway_scores(profile)
+        pathway_scores = self._get_pathway_scores(profile)
         pathway_score = pathway_scores.get(expected_pathway, 0.0)
         
-        # Calculate correlation
-        planet_norm = np.tanh(planet_strength / 5.0)
-        pathway_norm = np.tanh(pathway_score * 2.0)
+        # Calculate correlation (scalars, so math.tanh avoids ufunc dispatch)
+        planet_norm = math.tanh(planet_strength / 5.0)
+        pathway_norm = math.tanh(pathway_score * 2.0)
         correlation = planet_norm * pathway_norm
         
         # Statistical significance (simplified)
@@ -0,0 +1,67 @@
+"""Native PRS scoring kernels, compiled with numba when it is installed"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels below remain plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Genotype classes stored by PolygenicCalculator.encode_profile
+ABSENT = -1        # RSID not present in the profile
+NO_CALL = 0        # present, but not a two-allele call
+HETEROZYGOUS = 1
+HOMOZYGOUS = 2
+
+@njit()
+def prs_score(codes, w_het, w_hom, mask):
+    """Raw score and variant count of one trait for an encoded profile
+
+    ``w_het``, ``w_hom`` and ``mask`` are the trait's rows of the
+    calculator's weight matrices, aligned with ``codes``. Compiled on the
+    first call and, like score_cohort, not cached on disk.
+    """
+    score = 0.0
+    count = 0
+    for j in range(codes.shape[0]):
+        if mask[j] == 0.0:
+            continue
+        code = codes[j]
+        if code != ABSENT:
+            count += 1
+            if code == HETEROZYGOUS:
+                score += w_het[j]
+            elif code == HOMOZYGOUS:
+                score += w_hom[j]
+    return score, count
+
+@njit(parallel=True)
+def score_cohort(codes, w_het, w_hom, mask):
+    """Normalized scores of every trait for a stack of encoded profiles
+    
+    ``codes`` is ``(n_profiles, n_variants)``, the weight matrices are
+    ``(n_traits, n_variants)``; profiles are scored in parallel and each
+    score is divided by the square root of its variant count.
+    
+    Not cached on disk: a cached kernel records the name of the module it
+    was compiled under and fails to load when this file is later imported
+    as ``genetic._prs_numba`` rather than ``src.genetic._prs_numba`` (or
+    the other way round). It compiles on the first calculate_cohort call.
+    """
+    n_profiles = codes.shape[0]
+    n_traits = w_het.shape[0]
+    scores = np.zeros((n_profiles, n_traits))
+    for p in prange(n_profiles):
+        for t in range(n_traits):
+            score, count = prs_score(codes[p], w_het[t], w_hom[t], mask[t])
+            if count > 0:
+                scores[p, t] = score / np.sqrt(count)
+    return scores
@@ -2,11 +2,44 @@
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from collections import ChainMap
+from math import erfc, sqrt
+from types import MappingProxyType
+from scipy.special import ndtr
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from .variant_analyzer import GeneticProfile
+from .variant_analyzer import NO_CALL_GENOTYPES, GeneticProfile, VariantAnalyzer, intern_rsid
+from ._prs_numba import _NUMBA_AVAILABLE, ABSENT, NO_CALL, HETEROZYGOUS, HOMOZYGOUS, prs_score, score_cohort
 
-@dataclass
+_NO_CALL_ALLELES = np.frombuffer(''.join(g[0] for g in NO_CALL_GENOTYPES).encode('ascii'), dtype=np.uint8)
+
+# Category ladders per trait: (direction, cut points, labels). Cut points are
+# ascending in direction * z; strings name a threshold in the trait's
+# population reference. Direction -1 ranks lower z-scores higher.
+RISK_CATEGORY_LADDERS = {
+    'cardiovascular_disease': (
+        1, (-0.5, 0.5, 'high_risk_threshold'),
+        ('Low Risk', 'Average Risk', 'Moderate Risk', 'High Risk')
+    ),
+    'cognitive_ability': (
+        1, (-1.0, 0.0, 'high_ability_threshold'),
+        ('Below Average', 'Average', 'Above Average', 'High Ability')
+    ),
+    'inflammatory_response': (
+        1, (0.0, 'high_inflammation_threshold'),
+        ('Low Inflammation', 'Moderate Inflammation', 'High Inflammation')
+    ),
+    'metabolic_efficiency': (
+        -1, (-1.0, 0.0, 'efficient_threshold'),
+        ('Inefficient', 'Average', 'Efficient', 'Highly Efficient')
+    ),
+    'athletic_performance': (
+        1, (0.0, 1.0, 'elite_threshold'),
+        ('Average', 'Above Average', 'High Potential', 'Elite Potential')
+    )
+}
+
+@dataclass(slots=True)
 class PolygenicRiskScore:
     """Polygenic Risk Score for a specific trait"""
     trait: str
@@ -83,16 +116,186 @@ class PolygenicCalculator:
         }
     }
     
-    def __init__(self):
-        """Initialize polygenic calculator"""
-        self.trait_weights = self.PRS_WEIGHTS.copy()
-        self.references = self.POPULATION_REFERENCES.copy()
+    def __init__(self, quantize_weights: bool = False):
+        """Initialize polygenic calculator
+        
+        Args:
+            quantize_weights: Store trait weights as int8 with a per-trait
+                scale and score with integer matrix products. Scores then
+                differ from the exact ones by up to half a quantization step
+                (max |weight| / 254) per variant.
+        """
+        self.quantize_weights = quantize_weights
+        # Custom traits go into the front map; the class tables are never copied.
+        # The public views are read-only so every change goes through
+        # add_custom_trait, which rebuilds the scoring matrices.
+        self._trait_weights = ChainMap({}, self.PRS_WEIGHTS)
+        self._references = ChainMap({}, self.POPULATION_REFERENCES)
+        self.trait_weights = MappingProxyType(self._trait_weights)
+        self.references = MappingProxyType(self._references)
+        self._rebuild_index()
     
-    def calculate_prs(self, profile: GeneticProfile, trait: str) -> PolygenicRiskScore:
-        """Calculate Polygenic Risk Score for a specific trait
+    def _rebuild_index(self):
+        """Compile trait weights into dense matrices over one shared RSID index
+        
+        Every RSID used by any trait gets a column in ``_rsid_to_idx`` and
+        every trait a row in ``_trait_row``. ``_W`` holds the effect of a
+        heterozygous call (``weight``), ``_W_hom`` that of a homozygous call
+        (``2 * weight`` for risk variants, 0 for protective ones) and
+        ``_W_mask`` which RSIDs each trait reads; RSIDs a trait does not use
+        are zero in all three.
+        ``_id_to_idx`` maps interned RSID IDs (``GeneticVariant.rsid_id``)
+        to the same columns, -1 for IDs no trait uses.
+        """
+        self._rsid_to_idx: Dict[str, int] = {}
+        for weights in self.trait_weights.values():
+            for rsid in weights:
+                self._rsid_to_idx.setdefault(rsid, len(self._rsid_to_idx))
+        
+        ids = np.fromiter(map(intern_rsid, self._rsid_to_idx), dtype=np.intp, count=len(self._rsid_to_idx))
+        self._id_to_idx = np.full(ids.max(initial=-1) + 1, -1, dtype=np.intp)
+        self._id_to_idx[ids] = np.arange(len(ids))
+        
+        self._trait_names: Tuple[str, ...] = tuple(self.trait_weights)
+        self._trait_row: Dict[str, int] = {trait: row for row, trait in enumerate(self._trait_names)}
+        
+        shape = (len(self._trait_names), len(self._rsid_to_idx))
+        self._W = np.zeros(shape, dtype=np.float64)
+        self._W_mask = np.zeros(shape, dtype=np.float64)
+        for row, weights in enumerate(self.trait_weights.values()):
+            cols = [self._rsid_to_idx[rsid] for rsid in weights]
+            self._W[row, cols] = list(weights.values())
+            self._W_mask[row, cols] = 1.0
+        
+        self._W_hom = np.where(self._W > 0, 2.0 * self._W, 0.0)
+        self._trait_sizes = self._W_mask.sum(axis=1)
+        if self.quantize_weights:
+            self._W_q, self._W_scale = self._quantize_rows(self._W)
+            self._W_hom_q, self._W_hom_scale = self._quantize_rows(self._W_hom)
+        self._ref_mean = np.array([self.references[trait]['mean'] for trait in self._trait_names], dtype=np.float64)
+        self._ref_std = np.array([self.references[trait]['std'] for trait in self._trait_names], dtype=np.float64)
+        # Default references are N(0, 1), so their scores already are z-scores
+        self._is_standard_normal: Dict[str, bool] = {
+            trait: ref['mean'] == 0 and ref['std'] == 1 for trait, ref in self.references.items()
+        }
+        self._all_standard_normal = all(self._is_standard_normal.get(trait, False) for trait in self._trait_names)
+        self._risk_direction = np.array(
+            [1 if 'risk' in trait or 'disease' in trait else -1 for trait in self._trait_names], dtype=np.int8
+        )
+        self._build_category_tables()
+    
+    def _build_category_tables(self):
+        """Resolve RISK_CATEGORY_LADDERS into padded per-trait threshold rows
+        
+        Row ``i`` of ``_cat_thresholds`` holds trait ``i``'s cut points padded
+        with NaN (which no comparison passes), so counting the cut points at or below ``direction * z``
+        gives the index into ``_cat_labels[i]`` for every trait at once.
+        Traits without a ladder have no cut points and map to 'Unknown'.
+        """
+        ladders = []
+        for trait in self._trait_names:
+            direction, cuts, labels = RISK_CATEGORY_LADDERS.get(trait, (1, (), ('Unknown',)))
+            ref = self.references[trait]
+            cuts = [direction * ref[cut] if isinstance(cut, str) else cut for cut in cuts]
+            # The ladder checks its top category first, so a lower category's
+            # cut point never exceeds the ones above it
+            cuts = np.minimum.accumulate(np.array(cuts[::-1], dtype=np.float64))[::-1]
+            ladders.append((direction, cuts, labels))
+        
+        width = max((len(cuts) for _, cuts, _ in ladders), default=0)
+        self._cat_direction = np.array([direction for direction, _, _ in ladders], dtype=np.float64)
+        self._cat_thresholds = np.full((len(ladders), width), np.nan)
+        for row, (_, cuts, _) in enumerate(ladders):
+            self._cat_thresholds[row, :len(cuts)] = cuts
+        self._cat_labels: Tuple[Tuple[str, ...], ...] = tuple(labels for _, _, labels in ladders)
+    
+    @staticmethod
+    def _quantize_rows(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetric per-row int8 quantization, ``weights ~= q * scale[:, None]``"""
+        max_abs = np.abs(weights).max(axis=1, initial=0.0)
+        scale = np.where(max_abs > 0, max_abs / 127.0, 1.0)
+        return np.round(weights / scale[:, None]).astype(np.int8), scale
+    
+    def _raw_scores(self, codes: np.ndarray) -> np.ndarray:
+        """Unnormalized scores of every trait for one or more encoded profiles
+        
+        ``codes`` is ``(n_variants,)`` or ``(n_profiles, n_variants)``; traits
+        are the last axis of the result.
+        """
+        heterozygous = codes == HETEROZYGOUS
+        homozygous = codes == HOMOZYGOUS
+        
+        if self.quantize_weights:
+            # int8 weights against 0/1 indicators accumulate exactly in int32
+            return (heterozygous.astype(np.int32) @ self._W_q.T * self._W_scale
+                    + homozygous.astype(np.int32) @ self._W_hom_q.T * self._W_hom_scale)
+        return heterozygous @ self._W.T + homozygous @ self._W_hom.T
+    
+    def encode_profile(self, profile: GeneticProfile) -> np.ndarray:
+        """Encode a profile as one genotype class per indexed RSID
+        
+        The result is cached on the profile until this calculator's RSID
+        index changes or a variant is added to, removed from or replaced in
+        ``profile.variants``. Edits to a GeneticVariant in place are not
+        detected; replace the variant instead.
         
         Args:
             profile: Genetic profile
+            
+        Returns:
+            Read-only int8 array aligned with the calculator's RSID index
+            holding ABSENT, NO_CALL, HETEROZYGOUS or HOMOZYGOUS
+        """
+        variants = tuple(profile.variants.values())
+        cached = profile._encoded_cache
+        # Tuple equality checks identity first, so an unchanged profile is cheap
+        if cached is not None and cached[0] is self._rsid_to_idx and cached[1] == variants:
+            return cached[2]
+        
+        codes = self._encode_variants(profile)
+        codes.flags.writeable = False
+        profile._encoded_cache = (self._rsid_to_idx, variants, codes)
+        return codes
+    
+    def _encode_variants(self, profile: GeneticProfile) -> np.ndarray:
+        """Uncached body of encode_profile"""
+        codes = np.full(len(self._rsid_to_idx), ABSENT, dtype=np.int8)
+        if not profile.variants:
+            return codes
+        
+        ids = np.fromiter(
+            (variant.rsid_id for variant in profile.variants.values()),
+            dtype=np.intp, count=len(profile.variants)
+        )
+        # IDs interned after the index was built belong to no trait
+        cols = self._id_to_idx[np.minimum(ids, len(self._id_to_idx) - 1)]
+        cols[ids >= len(self._id_to_idx)] = -1
+        g0, g1 = VariantAnalyzer.parse_genotypes_to_arrays(profile)
+        indexed = cols >= 0
+        codes[cols[indexed]] = self._genotype_classes(g0[indexed], g1[indexed])
+        
+        return codes
+    
+    @staticmethod
+    def _genotype_classes(g0: np.ndarray, g1: np.ndarray) -> np.ndarray:
+        """Vectorized genotype classification of allele byte pairs
+        
+        Malformed calls (``g0 == 0``, see parse_genotypes_to_arrays) and
+        NO_CALL_GENOTYPES are NO_CALL; otherwise matching alleles are
+        HOMOZYGOUS and differing ones HETEROZYGOUS.
+        """
+        homozygous = g0 == g1
+        valid = (g0 != 0) & ~(homozygous & np.isin(g0, _NO_CALL_ALLELES))
+        classes = np.where(homozygous, HOMOZYGOUS, HETEROZYGOUS).astype(np.int8)
+        classes[~valid] = NO_CALL
+        return classes
+    
+    def calculate_prs(self, profile: Union[GeneticProfile, np.ndarray], trait: str) -> PolygenicRiskScore:
+        """Calculate Polygenic Risk Score for a specific trait
+        
+        Args:
+            profile: Genetic profile, or a profile already passed through
+                encode_profile (cheaper when scoring the same one repeatedly)
             trait: Trait name (e.g., 'cardiovascular_disease')
             
         Returns:
@@ -101,16 +304,23 @@ class PolygenicCalculator:
         if trait not in self.trait_weights:
             raise ValueError(f"Unknown trait: {trait}")
         
-        weights = self.trait_weights[trait]
-        score = 0.0
-        variant_count = 0
+        codes = profile if isinstance(profile, np.ndarray) else self.encode_profile(profile)
+        return self._prs_from_codes(codes, trait)
+    
+    def _prs_from_codes(self, codes: np.ndarray, trait: str) -> PolygenicRiskScore:
+        """Score one trait from an encoded profile (see encode_profile)"""
+        row = self._trait_row[trait]
         
-        for rsid, weight in weights.items():
-            if rsid in profile.variants:
-                variant = profile.variants[rsid]
-                genotype_effect = self._calculate_genotype_effect(variant.genotype, weight)
-                score += genotype_effect
-                variant_count += 1
+        if self.quantize_weights:
+            variant_count = int(self._W_mask[row] @ (codes != ABSENT))
+            score = float(self._raw_scores(codes)[row])
+        elif _NUMBA_AVAILABLE:
+            score, variant_count = prs_score(codes, self._W[row], self._W_hom[row], self._W_mask[row])
+        else:
+            # Same per-genotype effects as _calculate_genotype_effect, as two dots
+            variant_count = int(self._W_mask[row] @ (codes != ABSENT))
+            score = float(self._W[row] @ (codes == HETEROZYGOUS)
+                          + self._W_hom[row] @ (codes == HOMOZYGOUS))
         
         # Normalize score
         if variant_count > 0:
@@ -119,7 +329,7 @@ class PolygenicCalculator:
         # Calculate percentile and risk category
         percentile = self._calculate_percentile(score, trait)
         risk_category = self._determine_risk_category(score, trait)
-        confidence = min(variant_count / len(weights), 1.0)  # Confidence based on coverage
+        confidence = min(variant_count / self._trait_sizes[row], 1.0)  # Confidence based on coverage
         
         return PolygenicRiskScore(
             trait=trait,
@@ -132,7 +342,7 @@ class PolygenicCalculator:
     
     def _calculate_genotype_effect(self, genotype: str, weight: float) -> float:
         """Calculate effect based on genotype and weight"""
-        if len(genotype) != 2:
+        if len(genotype) != 2 or genotype in NO_CALL_GENOTYPES:
             return 0.0
         
         # Count risk alleles (simplified - assumes second allele is risk allele)
@@ -151,71 +361,76 @@ class PolygenicCalculator:
     
     def _calculate_percentile(self, score: float, trait: str) -> float:
         """Calculate population percentile for the score"""
-        ref = self.references[trait]
-        
         # Convert to z-score
-        z_score = (score - ref['mean']) / ref['std']
+        if self._is_standard_normal.get(trait, False):
+            z_score = score
+        else:
+            ref = self.references[trait]
+            z_score = (score - ref['mean']) / ref['std']
         
-        # Convert to percentile using normal CDF
-        from scipy.stats import norm
-        percentile = norm.cdf(z_score) * 100
+        # Convert to percentile using normal CDF (erfc form stays accurate in the lower tail)
+        percentile = 50.0 * erfc(-z_score / sqrt(2.0))
         
         return max(0, min(100, percentile))
     
+    def _percentiles_batch(self, z_scores: np.ndarray) -> np.ndarray:
+        """Population percentiles for an array of z-scores"""
+        return np.clip(ndtr(z_scores) * 100, 0, 100)
+    
     def _determine_risk_category(self, score: float, trait: str) -> str:
         """Determine risk category based on score"""
-        ref = self.references[trait]
-        z_score = (score - ref['mean']) / ref['std']
-        
-        if trait == 'cardiovascular_disease':
-            if z_score >= ref['high_risk_threshold']:
-                return 'High Risk'
-            elif z_score >= 0.5:
-                return 'Moderate Risk'
-            elif z_score >= -0.5:
-                return 'Average Risk'
-            else:
-                return 'Low Risk'
-        
-        elif trait == 'cognitive_ability':
-            if z_score >= ref['high_ability_threshold']:
-                return 'High Ability'
-            elif z_score >= 0:
-                return 'Above Average'
-            elif z_score >= -1:
-                return 'Average'
-            else:
-                return 'Below Average'
-        
-        elif trait == 'inflammatory_response':
-            if z_score >= ref['high_inflammation_threshold']:
-                return 'High Inflammation'
-            elif z_score >= 0:
-                return 'Moderate Inflammation'
-            else:
-                return 'Low Inflammation'
-        
-        elif trait == 'metabolic_efficiency':
-            if z_score <= ref['efficient_threshold']:
-                return 'Highly Efficient'
-            elif z_score <= 0:
-                return 'Efficient'
-            elif z_score <= 1:
-                return 'Average'
-            else:
-                return 'Inefficient'
-        
-        elif trait == 'athletic_performance':
-            if z_score >= ref['elite_threshold']:
-                return 'Elite Potential'
-            elif z_score >= 1:
-                return 'High Potential'
-            elif z_score >= 0:
-                return 'Above Average'
-            else:
-                return 'Average'
-        
-        return 'Unknown'
+        if self._is_standard_normal.get(trait, False):
+            z_score = score
+        else:
+            ref = self.references[trait]
+            z_score = (score - ref['mean']) / ref['std']
+        
+        row = self._trait_row.get(trait)
+        if row is None:
+            return 'Unknown'
+        
+        # Number of cut points at or below z (NaN passes none, like the original ladder)
+        level = int(np.count_nonzero(self._cat_direction[row] * z_score >= self._cat_thresholds[row]))
+        return self._cat_labels[row][level]
+    
+    def _score_vector(self, profile: GeneticProfile) -> Tuple[np.ndarray, np.ndarray]:
+        """Normalized scores and variant counts of every trait, in index order"""
+        codes = self.encode_profile(profile)
+        
+        # All traits in one pass: raw scores and coverage as matrix-vector products
+        raw = self._raw_scores(codes)
+        variant_counts = (self._W_mask @ (codes != ABSENT)).astype(np.int64)
+        scores = np.divide(raw, np.sqrt(variant_counts),
+                           out=np.zeros_like(raw), where=variant_counts > 0)
+        return scores, variant_counts
+    
+    def _rank_scores(self, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentiles and risk-category levels of a score vector"""
+        z_scores = scores if self._all_standard_normal else (scores - self._ref_mean) / self._ref_std
+        levels = np.count_nonzero(
+            (self._cat_direction * z_scores)[:, None] >= self._cat_thresholds, axis=1
+        )
+        return self._percentiles_batch(z_scores), levels
+    
+    def _build_scores(self, rows: np.ndarray, scores: np.ndarray, variant_counts: np.ndarray,
+                      percentiles: np.ndarray, levels: np.ndarray) -> List[PolygenicRiskScore]:
+        """Materialize PolygenicRiskScore objects for the selected trait rows only"""
+        counts = variant_counts[rows]
+        confidences = np.minimum(counts / self._trait_sizes[rows], 1.0)
+        return [
+            PolygenicRiskScore(
+                trait=self._trait_names[row],
+                score=score,
+                percentile=percentile,
+                risk_category=self._cat_labels[row][level],
+                variant_count=variant_count,
+                confidence=confidence
+            )
+            for row, score, percentile, level, variant_count, confidence in zip(
+                rows.tolist(), scores[rows], percentiles[rows], levels[rows].tolist(),
+                counts.tolist(), confidences.tolist()
+            )
+        ]
     
     def calculate_all_prs(self, profile: GeneticProfile) -> Dict[str, PolygenicRiskScore]:
         """Calculate PRS for all available traits
@@ -226,12 +441,35 @@ class PolygenicCalculator:
         Returns:
             Dictionary mapping trait names to PRS scores
         """
-        prs_scores = {}
+        scores, variant_counts = self._score_vector(profile)
+        percentiles, levels = self._rank_scores(scores)
+        rows = np.arange(len(self._trait_names))
+        return {prs.trait: prs for prs in self._build_scores(rows, scores, variant_counts, percentiles, levels)}
+    
+    def calculate_cohort(self, profiles: List[GeneticProfile]) -> pd.DataFrame:
+        """Normalized PRS of every trait for many profiles at once
+        
+        Args:
+            profiles: Genetic profiles to score
+            
+        Returns:
+            DataFrame of scores (as in PolygenicRiskScore.score) indexed by
+            sample ID with one column per trait
+        """
+        codes = np.empty((len(profiles), len(self._rsid_to_idx)), dtype=np.int8)
+        for i, profile in enumerate(profiles):
+            codes[i] = self.encode_profile(profile)
         
-        for trait in self.trait_weights.keys():
-            prs_scores[trait] = self.calculate_prs(profile, trait)
+        if _NUMBA_AVAILABLE and not self.quantize_weights:
+            scores = score_cohort(codes, self._W, self._W_hom, self._W_mask)
+        else:
+            raw = self._raw_scores(codes)
+            variant_counts = (codes != ABSENT) @ self._W_mask.T
+            scores = np.divide(raw, np.sqrt(variant_counts),
+                               out=np.zeros_like(raw), where=variant_counts > 0)
         
-        return prs_scores
+        return pd.DataFrame(scores, index=[profile.sample_id for profile in profiles],
+                            columns=list(self._trait_names))
     
     def get_top_risk_traits(self, profile: GeneticProfile, n: int = 3) -> List[PolygenicRiskScore]:
         """Get top risk traits based on percentile scores
@@ -243,16 +481,29 @@ class PolygenicCalculator:
         Returns:
             List of top risk PRS scores
         """
-        all_prs = self.calculate_all_prs(profile)
+        scores, variant_counts = self._score_vector(profile)
+        percentiles, levels = self._rank_scores(scores)
         
-        # Sort by percentile (descending for risk traits)
-        sorted_prs = sorted(
-            all_prs.values(),
-            key=lambda prs: prs.percentile if 'risk' in prs.trait or 'disease' in prs.trait else 100 - prs.percentile,
-            reverse=True
-        )
+        # Rank by percentile (descending for risk traits, so ability traits use 100 - percentile)
+        ranking = np.where(self._risk_direction > 0, percentiles, 100 - percentiles)
+        top = np.asarray(self._top_indices(ranking, n), dtype=np.intp)
+        return self._build_scores(top, scores, variant_counts, percentiles, levels)
+    
+    @staticmethod
+    def _top_indices(values: np.ndarray, n: int) -> np.ndarray:
+        """Indices of the ``n`` largest values, largest first, ties in index order
+        
+        Same selection as ``sorted(..., reverse=True)[:n]`` but partitions
+        instead of sorting everything when ``n`` is smaller than the input.
+        """
+        if n <= 0 or n >= len(values):
+            return np.argsort(-values, kind='stable')[:n]
         
-        return sorted_prs[:n]
+        kth = -np.partition(-values, n - 1)[n - 1]
+        better = np.flatnonzero(values > kth)
+        tied = np.flatnonzero(values == kth)[:n - len(better)]
+        top = np.concatenate([better, tied])
+        return top[np.argsort(-values[top], kind='stable')]
     
     def add_custom_trait(self, trait_name: str, variant_weights: Dict[str, float], 
                         population_params: Dict[str, float]):
@@ -263,5 +514,6 @@ class PolygenicCalculator:
             variant_weights: Dictionary mapping RSIDs to effect weights
             population_params: Population parameters (mean, std, thresholds)
         """
-        self.trait_weights[trait_name] = variant_weights
-        self.references[trait_name] = population_params
\ No newline at end of file
+        self._trait_weights[trait_name] = dict(variant_weights)
+        self._references[trait_name] = dict(population_params)
+        self._rebuild_index()
\ No newline at end of file
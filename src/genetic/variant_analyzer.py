@@ -4,13 +4,71 @@ Genetic Variant Analyzer - Core genetic data processing module
 Extracted from comprehensive analysis scripts and modularized
 """
 
+import csv
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
-@dataclass
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pyarrow is an optional accelerator
+    _PYARROW_AVAILABLE = False
+
+# Genotype calls that carry no allele information
+NO_CALL_GENOTYPES = ('--', 'II', 'DD')
+
+# Small integer codes for grouping variants; -1 marks a missing or unlisted value
+ELEMENT_CODES = {'fire': 0, 'earth': 1, 'air': 2, 'water': 3}
+PATHWAY_CODES = {
+    'inflammation': 0, 'athletic': 1, 'metabolic': 2, 'cardiovascular': 3,
+    'neurotransmitter': 4, 'emotional': 5, 'detoxification': 6, 'drug_metabolism': 7
+}
+
+# Process-wide dense integer ID of every RSID seen, assigned on first use
+RSID_TO_ID: Dict[str, int] = {}
+
+def intern_rsid(rsid: str) -> int:
+    """Integer ID of an RSID, registering it in RSID_TO_ID if it is new"""
+    rsid_id = RSID_TO_ID.get(rsid)
+    if rsid_id is None:
+        rsid_id = RSID_TO_ID[rsid] = len(RSID_TO_ID)
+    return rsid_id
+
+# Genotype category by number of risk alleles
+_GENOTYPE_CATEGORIES = ('sensitive', 'intermediate', 'extreme')
+
+# (genotype, risk allele) -> (risk allele count, category) for all 16 base pairs
+# in either case, so lookups need no upper(). No-calls and malformed genotypes
+# are simply absent. Without a known risk allele only heterozygous calls can be
+# classified.
+_GENO_LUT: Dict[Tuple[str, Optional[str]], Tuple[int, str]] = {
+    (first + second, risk): (count, _GENOTYPE_CATEGORIES[count])
+    for first in 'ACGTacgt' for second in 'ACGTacgt' for risk in 'ACGT'
+    for count in [(first.upper() == risk) + (second.upper() == risk)]
+}
+_GENO_LUT.update({
+    (first + second, None): (1, _GENOTYPE_CATEGORIES[1])
+    for first in 'ACGTacgt' for second in 'ACGTacgt' if first.upper() != second.upper()
+})
+
+# Leading columns of a 23andMe-style raw data file
+GENOTYPE_FILE_COLUMNS = ['rsid', 'chromosome', 'position', 'genotype']
+
+# pyarrow CSV block size; each block is parsed on its own thread
+_ARROW_BLOCK_SIZE = 8 << 20
+
+# First four tab-separated fields of a raw data line, surrounding whitespace trimmed
+_GENOTYPE_LINE_PATTERN = (
+    r'^\s*(?P<rsid>[^\t]*)\t(?P<chromosome>[^\t]*)\t(?P<position>[^\t]*)'
+    r'\t(?P<genotype>[^\t]*?)\s*(?:\t|$)'
+)
+
+@dataclass(slots=True)
 class GeneticVariant:
     """Represents a genetic variant with all associated data"""
     rsid: str
@@ -22,38 +80,43 @@ class GeneticVariant:
     gene: Optional[str] = None
     pathway: Optional[str] = None
     element: Optional[str] = None
+    risk_allele: Optional[str] = None
+    # Derived in __post_init__; genotype fields stay None for no-calls
+    numeric_genotype: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    genotype_category: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    element_code: int = field(default=-1, init=False, repr=False, compare=False)
+    pathway_code: int = field(default=-1, init=False, repr=False, compare=False)
+    rsid_id: int = field(default=-1, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Calculate derived properties"""
-        if self.genotype and self.genotype not in ['--', 'II', 'DD']:
-            alleles = list(self.genotype.upper())
-            if len(alleles) == 2:
-                unique_alleles = set(alleles)
-                if len(unique_alleles) == 1:
-                    self.numeric_genotype = 0 if alleles[0] <= 'G' else 2
-                else:
-                    self.numeric_genotype = 1  # Heterozygous
-                
-                self.genotype_category = 'sensitive' if self.numeric_genotype == 0 else (
-                    'extreme' if self.numeric_genotype == 2 else 'intermediate'
-                )
+        self.rsid_id = intern_rsid(self.rsid)
+        self.element_code = ELEMENT_CODES.get(self.element, -1)
+        self.pathway_code = PATHWAY_CODES.get(self.pathway, -1)
+        derived = _GENO_LUT.get((self.genotype, self.risk_allele))
+        if derived is not None:
+            self.numeric_genotype, self.genotype_category = derived
 
-@dataclass
+@dataclass(slots=True)
 class GeneticProfile:
     """Complete genetic profile for an individual"""
     sample_id: str
     variants: Dict[str, GeneticVariant]
     total_snps_processed: int = 0
+    # (RSID index, variants, codes) from the last PolygenicCalculator.encode_profile call
+    _encoded_cache: Optional[Tuple[Dict[str, int], Tuple[GeneticVariant, ...], np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_variants_by_element(self) -> Dict[str, List[GeneticVariant]]:
         """Group variants by astrological element"""
-        element_variants = {'fire': [], 'earth': [], 'air': [], 'water': []}
+        variants = list(self.variants.values())
+        codes = np.fromiter((variant.element_code for variant in variants), dtype=np.int8, count=len(variants))
         
-        for variant in self.variants.values():
-            if variant.element and variant.element in element_variants:
-                element_variants[variant.element].append(variant)
-        
-        return element_variants
+        return {
+            element: [variants[i] for i in np.flatnonzero(codes == code)]
+            for element, code in ELEMENT_CODES.items()
+        }
     
     def get_variants_by_pathway(self) -> Dict[str, List[GeneticVariant]]:
         """Group variants by biological pathway"""
@@ -73,109 +136,227 @@ class VariantAnalyzer:
     def __init__(self):
         """Initialize with comprehensive variant database"""
         self.variant_db = self._load_variant_database()
+        for rsid in self.variant_db:
+            intern_rsid(rsid)
+        self.variant_table = self._load_variant_database_soa()
+        self._variant_rsids = frozenset(self.variant_table.index)
     
     def _load_variant_database(self) -> Dict[str, Dict]:
-        """Load comprehensive genetic variant database with astrological mappings"""
+        """Load comprehensive genetic variant database with astrological mappings
+        
+        ``risk_allele`` is the effect allele on the forward strand as reported
+        in 23andMe raw data; None where the call is strand-ambiguous (the C/G
+        SNPs rs1800795, rs1801282, rs1333049 and rs6295), so only their
+        heterozygous calls are classified.
+        """
         return {
             # Fire/Inflammation variants (Mars ruled)
             'rs1800896': {
                 'gene': 'IL10', 'pathway': 'inflammation', 'element': 'fire', 
-                'effect_size': 0.5, 'clinical_significance': 'moderate'
+                'effect_size': 0.5, 'clinical_significance': 'moderate', 'risk_allele': 'T'
             },
             'rs1143634': {
                 'gene': 'IL1B', 'pathway': 'inflammation', 'element': 'fire',
-                'effect_size': 0.7, 'clinical_significance': 'moderate'
+                'effect_size': 0.7, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             'rs20541': {
                 'gene': 'IL13', 'pathway': 'inflammation', 'element': 'fire',
-                'effect_size': 0.6, 'clinical_significance': 'moderate'
+                'effect_size': 0.6, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             'rs361525': {
                 'gene': 'TNF', 'pathway': 'inflammation', 'element': 'fire',
-                'effect_size': 0.8, 'clinical_significance': 'high'
+                'effect_size': 0.8, 'clinical_significance': 'high', 'risk_allele': 'A'
             },
             'rs1800795': {
                 'gene': 'IL6', 'pathway': 'inflammation', 'element': 'fire',
-                'effect_size': 0.9, 'clinical_significance': 'high'
+                'effect_size': 0.9, 'clinical_significance': 'high', 'risk_allele': None
             },
             'rs1815739': {
                 'gene': 'ACTN3', 'pathway': 'athletic', 'element': 'fire',
-                'effect_size': 1.2, 'clinical_significance': 'high'
+                'effect_size': 1.2, 'clinical_significance': 'high', 'risk_allele': 'T'
             },
             
             # Earth/Physical variants (Saturn/Venus ruled)
             'rs1801282': {
                 'gene': 'PPARG', 'pathway': 'metabolic', 'element': 'earth',
-                'effect_size': 1.2, 'clinical_significance': 'high'
+                'effect_size': 1.2, 'clinical_significance': 'high', 'risk_allele': None
             },
             'rs7903146': {
                 'gene': 'TCF7L2', 'pathway': 'metabolic', 'element': 'earth',
-                'effect_size': 1.5, 'clinical_significance': 'very_high'
+                'effect_size': 1.5, 'clinical_significance': 'very_high', 'risk_allele': 'T'
             },
             'rs1333049': {
                 'gene': 'CDKN2A', 'pathway': 'cardiovascular', 'element': 'earth',
-                'effect_size': 1.1, 'clinical_significance': 'moderate'
+                'effect_size': 1.1, 'clinical_significance': 'moderate', 'risk_allele': None
             },
             'rs10757278': {
                 'gene': 'CDKN2A', 'pathway': 'cardiovascular', 'element': 'earth',
-                'effect_size': 1.0, 'clinical_significance': 'moderate'
+                'effect_size': 1.0, 'clinical_significance': 'moderate', 'risk_allele': 'G'
             },
             'rs429358': {
                 'gene': 'APOE', 'pathway': 'cardiovascular', 'element': 'earth',
-                'effect_size': 2.5, 'clinical_significance': 'very_high'
+                'effect_size': 2.5, 'clinical_significance': 'very_high', 'risk_allele': 'C'
             },
             'rs7412': {
                 'gene': 'APOE', 'pathway': 'cardiovascular', 'element': 'earth',
-                'effect_size': -1.8, 'clinical_significance': 'high'  # Protective
+                'effect_size': -1.8, 'clinical_significance': 'high', 'risk_allele': 'T'  # Protective
             },
             
             # Air/Cognitive variants (Mercury ruled)
             'rs53576': {
                 'gene': 'OXTR', 'pathway': 'neurotransmitter', 'element': 'air',
-                'effect_size': 0.8, 'clinical_significance': 'moderate'
+                'effect_size': 0.8, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             'rs6265': {
                 'gene': 'BDNF', 'pathway': 'neurotransmitter', 'element': 'air',
-                'effect_size': 1.0, 'clinical_significance': 'moderate'
+                'effect_size': 1.0, 'clinical_significance': 'moderate', 'risk_allele': 'T'
             },
             'rs1800497': {
                 'gene': 'DRD2', 'pathway': 'neurotransmitter', 'element': 'air',
-                'effect_size': 0.9, 'clinical_significance': 'moderate'
+                'effect_size': 0.9, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             'rs4680': {
                 'gene': 'COMT', 'pathway': 'neurotransmitter', 'element': 'air',
-                'effect_size': 0.8, 'clinical_significance': 'moderate'
+                'effect_size': 0.8, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             
             # Water/Emotional variants (Moon ruled)
             'rs6295': {
                 'gene': 'HTR1A', 'pathway': 'emotional', 'element': 'water',
-                'effect_size': 0.7, 'clinical_significance': 'moderate'
+                'effect_size': 0.7, 'clinical_significance': 'moderate', 'risk_allele': None
             },
             'rs1006737': {
                 'gene': 'CACNA1C', 'pathway': 'emotional', 'element': 'water',
-                'effect_size': 1.1, 'clinical_significance': 'moderate'
+                'effect_size': 1.1, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             },
             'rs4570625': {
                 'gene': 'TPH2', 'pathway': 'emotional', 'element': 'water',
-                'effect_size': 0.9, 'clinical_significance': 'moderate'
+                'effect_size': 0.9, 'clinical_significance': 'moderate', 'risk_allele': 'T'
             },
             
             # Additional high-impact variants
             'rs1801133': {
                 'gene': 'MTHFR', 'pathway': 'metabolic', 'element': 'earth',
-                'effect_size': 1.3, 'clinical_significance': 'high'
+                'effect_size': 1.3, 'clinical_significance': 'high', 'risk_allele': 'A'
             },
             'rs662': {
                 'gene': 'PON1', 'pathway': 'detoxification', 'element': 'earth',
-                'effect_size': 0.6, 'clinical_significance': 'moderate'
+                'effect_size': 0.6, 'clinical_significance': 'moderate', 'risk_allele': 'C'
             },
             'rs1045642': {
                 'gene': 'ABCB1', 'pathway': 'drug_metabolism', 'element': 'earth',
-                'effect_size': 0.7, 'clinical_significance': 'moderate'
+                'effect_size': 0.7, 'clinical_significance': 'moderate', 'risk_allele': 'A'
             }
         }
     
+    @staticmethod
+    def parse_genotypes_to_arrays(profile: GeneticProfile) -> Tuple[np.ndarray, np.ndarray]:
+        """Split a profile's genotypes into first/second allele byte arrays
+        
+        Args:
+            profile: Genetic profile
+            
+        Returns:
+            Tuple of uint8 arrays ``(g0, g1)`` in ``profile.variants`` order.
+            Genotypes that are not exactly two characters become ``(0, 0)``.
+        """
+        joined = ''.join(
+            genotype if len(genotype) == 2 else '\0\0'
+            for genotype in (variant.genotype for variant in profile.variants.values())
+        )
+        pairs = np.frombuffer(joined.encode('ascii', errors='replace'), dtype=np.uint8).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+    
+    def _load_variant_database_soa(self) -> pd.DataFrame:
+        """Columnar copy of the variant database, one row per RSID
+        
+        Text attributes are categorical; effect sizes stay float64 so they
+        match the values in ``variant_db`` exactly.
+        """
+        table = pd.DataFrame.from_dict(self.variant_db, orient='index')
+        table.index.name = 'rsid'
+        for column in ('gene', 'pathway', 'element', 'clinical_significance', 'risk_allele'):
+            table[column] = table[column].astype('category')
+        return table
+    
+    def _read_genotype_rows(self, file_path: str) -> Tuple[pd.DataFrame, int]:
+        """Read the rows of a raw genotype file that are in the variant database
+        
+        Uses pyarrow when installed, so the RSID filter runs before any rows
+        reach pandas; falls back to pandas.read_csv otherwise.
+        
+        Returns:
+            Tuple of (matching rows, number of data rows in the file)
+        """
+        if Path(file_path).stat().st_size == 0:  # neither reader can map an empty file
+            return pd.DataFrame(columns=GENOTYPE_FILE_COLUMNS), 0
+        if _PYARROW_AVAILABLE:
+            return self._read_genotype_rows_arrow(file_path)
+        return self._read_genotype_rows_pandas(file_path)
+    
+    def _read_genotype_rows_pandas(self, file_path: str) -> Tuple[pd.DataFrame, int]:
+        """pandas implementation of _read_genotype_rows
+        
+        Fields are split by the C parser with quotes treated as plain text, and
+        lines it cannot split are skipped rather than failing the file. RSIDs
+        stay plain strings: they are unique per row, so a categorical would
+        only add a 600k-entry hash table. Only rows that pass the RSID filter
+        get per-row work; their positions become int32, and a non-integer
+        position raises as int() would.
+        """
+        try:
+            df = pd.read_csv(
+                file_path, sep='\t', comment='#', header=None, engine='c',
+                names=GENOTYPE_FILE_COLUMNS, usecols=[0, 1, 2, 3],
+                dtype={'rsid': str, 'chromosome': 'category', 'position': str,
+                       'genotype': 'category'},
+                quoting=csv.QUOTE_NONE, on_bad_lines='skip', na_filter=False,
+                skipinitialspace=True
+            )
+        except pd.errors.EmptyDataError:  # only blank or comment lines
+            return pd.DataFrame(columns=GENOTYPE_FILE_COLUMNS), 0
+        
+        rows = df.loc[df['rsid'].isin(self._variant_rsids)]
+        rows = rows.assign(
+            chromosome=rows['chromosome'].astype(str),
+            position=pd.to_numeric(rows['position'], errors='coerce').astype('Int32'),
+            genotype=rows['genotype'].astype(str).str.rstrip()
+        )
+        return rows.reset_index(drop=True), len(df)
+    
+    def _read_genotype_rows_arrow(self, file_path: str) -> Tuple[pd.DataFrame, int]:
+        """pyarrow implementation of _read_genotype_rows
+        
+        pyarrow's CSV reader cannot skip comments or ragged rows, so it reads
+        whole lines. Only the leading RSID is split off every line; the full
+        _GENOTYPE_LINE_PATTERN runs on the few lines that pass the filter,
+        and lines with fewer than four fields do not match it.
+        """
+        # Memory-mapped input parsed in multi-threaded 8 MiB blocks
+        with pa.memory_map(str(file_path), 'r') as source:
+            lines = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(
+                    column_names=['line'], block_size=_ARROW_BLOCK_SIZE, use_threads=True
+                ),
+                parse_options=pa_csv.ParseOptions(delimiter='\x1f', quote_char=False),
+                convert_options=pa_csv.ConvertOptions(column_types={'line': pa.string()})
+            )['line']
+        lines = lines.filter(pa_compute.invert(pa_compute.starts_with(lines, '#')))
+        
+        rsids = pa_compute.utf8_ltrim_whitespace(
+            pa_compute.list_element(pa_compute.split_pattern(lines, '\t', max_splits=1), 0)
+        )
+        mask = pa_compute.is_in(rsids, value_set=pa.array(list(self._variant_rsids), pa.string()))
+        
+        fields = pa_compute.extract_regex(lines.filter(mask), _GENOTYPE_LINE_PATTERN)
+        fields = fields.filter(pa_compute.is_valid(fields))
+        rows = pd.DataFrame({
+            column: pa_compute.struct_field(fields, column).to_pylist()
+            for column in GENOTYPE_FILE_COLUMNS
+        })
+        return rows, len(lines)
+    
     def load_genetic_data(self, file_path: str) -> GeneticProfile:
         """Load genetic data from 23andMe or similar format"""
         found_variants = {}
@@ -184,39 +365,27 @@ class VariantAnalyzer:
         print(f"📊 Loading genetic data from {file_path}")
         
         try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    total_lines += 1
-                    
-                    if total_lines % 100000 == 0:
-                        print(f"   Processing line {total_lines:,}...")
-                    
-                    if line.startswith('#'):
-                        continue
-                    
-                    parts = line.strip().split('\t')
-                    if len(parts) >= 4:
-                        rsid = parts[0]
-                        chromosome = parts[1]
-                        position = parts[2]
-                        genotype = parts[3]
-                        
-                        if rsid in self.variant_db:
-                            variant_info = self.variant_db[rsid]
-                            
-                            variant = GeneticVariant(
-                                rsid=rsid,
-                                chromosome=chromosome,
-                                position=int(position),
-                                genotype=genotype,
-                                gene=variant_info['gene'],
-                                pathway=variant_info['pathway'],
-                                element=variant_info['element'],
-                                effect_size=variant_info['effect_size'],
-                                clinical_significance=variant_info['clinical_significance']
-                            )
-                            
-                            found_variants[rsid] = variant
+            # Parse and filter in C; only rows in the variant database become objects
+            rows, total_lines = self._read_genotype_rows(file_path)
+            
+            # Rows with a missing genotype come back as an empty string
+            matches = rows.loc[rows['genotype'] != ''].join(self.variant_table, on='rsid')
+            matches = matches.astype(object).where(matches.notna(), None)  # NaN -> None
+            for row in matches.itertuples(index=False):
+                variant = GeneticVariant(
+                    rsid=row.rsid,
+                    chromosome=row.chromosome,
+                    position=int(row.position),
+                    genotype=row.genotype,
+                    gene=row.gene,
+                    pathway=row.pathway,
+                    element=row.element,
+                    effect_size=row.effect_size,
+                    clinical_significance=row.clinical_significance,
+                    risk_allele=row.risk_allele
+                )
+                
+                found_variants[row.rsid] = variant
             
             profile = GeneticProfile(
                 sample_id=Path(file_path).stem,
@@ -1,11 +1,28 @@
 """Integration framework for comprehensive analysis"""
 
-from .comprehensive_analysis import ComprehensiveAnalyzer
-from .methodology_integrator import MethodologyIntegrator
-from .results_synthesizer import ResultsSynthesizer
+import importlib
+
+_LAZY_IMPORTS = {
+    "ComprehensiveAnalyzer": ".comprehensive_analysis",
+    "MethodologyIntegrator": ".methodology_integrator",
+    "ResultsSynthesizer": ".results_synthesizer",
+}
 
 __all__ = [
     "ComprehensiveAnalyzer",
     "MethodologyIntegrator",
     "ResultsSynthesizer"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import exported classes on first access (PEP 562)
+
+    ``import integration`` stays cheap; comprehensive_analysis, and the
+    numpy/scipy/ephemeris stack it pulls in, loads when first used.
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
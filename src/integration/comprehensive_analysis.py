@@ -1,8 +1,12 @@
 """Comprehensive Analysis Framework - Integrates all methodologies"""
 
+import heapq
+import math
+from operator import itemgetter
+
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -12,7 +16,7 @@ from ..correlation.dignity_correlation import DignityCorrelation
 from ..correlation.pathway_correlation import PathwayCorrelation
 from ..statistical.validation import StatisticalValidator
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComprehensiveResults:
     """Complete analysis results from all methodologies"""
     overall_correlation: float
@@ -51,6 +55,19 @@ class ComprehensiveAnalyzer:
         # Step 1: Calculate birth chart
         chart = self.chart_calc.calculate_chart(birth_datetime, latitude, longitude)
         
+        return self.comprehensive_chart_analysis(chart, genetic_file_path)
+    
+    def comprehensive_chart_analysis(self, chart: BirthChart,
+                                     genetic_file_path: str) -> ComprehensiveResults:
+        """Perform comprehensive analysis for an already calculated birth chart
+        
+        Args:
+            chart: Birth chart (may be shared by several subjects)
+            genetic_file_path: Path to genetic data file
+            
+        Returns:
+            Complete analysis results
+        """
         # Step 2: Load and process genetic data
         profile = self.variant_analyzer.load_genetic_data(genetic_file_path)
         
@@ -77,8 +94,10 @@ class ComprehensiveAnalyzer:
             'method_weight': 0.35  # Second highest weight
         }
         
-        # Polygenic Risk Score Analysis
-        polygenic_results = self._analyze_polygenic_correlations(chart, profile)
+        # Polygenic Risk Score Analysis, reusing the dignity and PRS scores
+        # the dignity analysis already computed for this chart and profile
+        dignity_scores = self.dignity_correlation.calculate_dignities(chart)
+        polygenic_results = self._analyze_polygenic_correlations(chart, profile, dignity_scores)
         methodology_results['polygenic'] = {
             'correlation': polygenic_results['overall_correlation'],
             'trait_correlations': polygenic_results['trait_correlations'],
@@ -106,15 +125,21 @@ class ComprehensiveAnalyzer:
             recommendations=recommendations
         )
     
-    def _analyze_polygenic_correlations(self, chart: BirthChart, profile: GeneticProfile) -> Dict:
-        """Analyze correlations using polygenic risk scores"""
-        from ..genetic.polygenic_calculator import PolygenicCalculator
+    def _analyze_polygenic_correlations(self, chart: BirthChart, profile: GeneticProfile,
+                                        dignity_scores: Optional[Dict[str, Dict]] = None) -> Dict:
+        """Analyze correlations using polygenic risk scores
         
-        polygenic_calc = PolygenicCalculator()
-        prs_scores = polygenic_calc.calculate_all_prs(profile)
+        Args:
+            chart: Birth chart
+            profile: Genetic profile
+            dignity_scores: Dignity scores of ``chart`` if already calculated
+        """
+        # PRS and dignity scores are shared with the dignity analysis's caches
+        prs_scores = self.dignity_correlation.calculate_prs(profile)
         
         # Map PRS traits to planetary strengths
-        dignity_scores = self.dignity_correlation.dignity_calc.calculate_all_dignities(chart)
+        if dignity_scores is None:
+            dignity_scores = self.dignity_correlation.calculate_dignities(chart)
         
         trait_correlations = {}
         correlations = []
@@ -134,7 +159,7 @@ class ComprehensiveAnalyzer:
                 dignity_score = dignity_scores[planet]['total']
                 
                 # Calculate correlation between PRS and dignity
-                correlation = np.tanh(prs_score) * np.tanh(dignity_score / 5.0)
+                correlation = math.tanh(prs_score) * math.tanh(dignity_score / 5.0)
                 
                 trait_correlations[trait] = {
                     'correlation': correlation,
@@ -157,38 +182,36 @@ class ComprehensiveAnalyzer:
     
     def _meta_analyze_results(self, methodology_results: Dict[str, Dict]) -> Dict:
         """Perform meta-analysis across all methodologies"""
-        # Weight correlations by method importance and confidence
-        weighted_correlations = []
-        total_weight = 0.0
+        results_list = list(methodology_results.values())
+        n_methods = len(results_list)
+        correlations = np.fromiter((results['correlation'] for results in results_list),
+                                   dtype=np.float64, count=n_methods)
+        weights = np.fromiter((results['method_weight'] for results in results_list),
+                              dtype=np.float64, count=n_methods)
+        
+        # Method-specific confidence, if available (confidence_level takes precedence)
+        has_confidence = np.fromiter(
+            ('confidence_level' in results or 'confidence' in results for results in results_list),
+            dtype=bool, count=n_methods
+        )
+        confidences = np.fromiter(
+            (results.get('confidence_level', results.get('confidence', 1.0)) for results in results_list),
+            dtype=np.float64, count=n_methods
+        )
         
-        for method_name, results in methodology_results.items():
-            correlation = results['correlation']
-            weight = results['method_weight']
-            
-            # Adjust weight by method-specific confidence if available
-            if 'confidence_level' in results:
-                weight *= results['confidence_level']
-            elif 'confidence' in results:
-                weight *= results['confidence']
-            
-            weighted_correlations.append(correlation * weight)
-            total_weight += weight
+        # Weight correlations by method importance and confidence
+        weights *= np.where(has_confidence, confidences, 1.0)
+        total_weight = float(weights.sum())
         
         # Calculate combined correlation
         if total_weight > 0:
-            combined_correlation = sum(weighted_correlations) / total_weight
+            combined_correlation = float(correlations @ weights) / total_weight
         else:
             combined_correlation = 0.0
         
         # Calculate combined confidence
-        confidences = []
-        for results in methodology_results.values():
-            if 'confidence_level' in results:
-                confidences.append(results['confidence_level'])
-            elif 'confidence' in results:
-                confidences.append(results['confidence'])
-        
-        combined_confidence = np.mean(confidences) if confidences else 0.0
+        confidences = confidences[has_confidence]
+        combined_confidence = float(confidences.mean()) if confidences.size else 0.0
         
         # Identify top correlations across all methods
         top_correlations = self._extract_top_correlations(methodology_results)
@@ -202,53 +225,54 @@ class ComprehensiveAnalyzer:
     
     def _extract_top_correlations(self, methodology_results: Dict) -> List[Dict]:
         """Extract top correlations from all methodologies"""
-        all_correlations = []
-        
+        # Top 5 by strength; same order as a stable descending sort
+        return heapq.nlargest(5, self._iter_correlations(methodology_results), key=itemgetter('strength'))
+    
+    def _iter_correlations(self, methodology_results: Dict) -> Iterator[Dict]:
+        """Yield the correlations reported by every methodology"""
         # From dignity analysis
         if 'dignity' in methodology_results:
             for corr in methodology_results['dignity'].get('significant_correlations', []):
-                all_correlations.append({
+                yield {
                     'method': 'dignity',
                     'type': 'planet-genetic',
                     'strength': corr['strength'],
                     'details': corr
-                })
+                }
         
         # From pathway analysis  
         if 'pathway' in methodology_results:
             for corr in methodology_results['pathway'].get('strongest_correlations', []):
-                all_correlations.append({
+                yield {
                     'method': 'pathway',
                     'type': 'planet-pathway',
                     'strength': corr['strength'],
                     'details': corr
-                })
+                }
         
         # From polygenic analysis
         if 'polygenic' in methodology_results:
             for trait, corr_info in methodology_results['polygenic'].get('trait_correlations', {}).items():
-                all_correlations.append({
+                yield {
                     'method': 'polygenic',
                     'type': 'trait-planet',
                     'strength': abs(corr_info['correlation']) * corr_info['confidence'],
                     'details': {'trait': trait, **corr_info}
-                })
-        
-        # Sort by strength and return top 5
-        return sorted(all_correlations, key=lambda x: x['strength'], reverse=True)[:5]
+                }
     
     def _validate_results(self, methodology_results: Dict, chart: BirthChart, profile: GeneticProfile) -> Dict:
         """Statistical validation of results"""
         validation = {}
         
         # Basic validation metrics
-        correlations = [results['correlation'] for results in methodology_results.values()]
+        correlations = np.fromiter((results['correlation'] for results in methodology_results.values()),
+                                   dtype=np.float64, count=len(methodology_results))
         
         validation['consistency'] = {
-            'mean_correlation': np.mean(correlations),
-            'std_correlation': np.std(correlations),
-            'min_correlation': np.min(correlations),
-            'max_correlation': np.max(correlations)
+            'mean_correlation': correlations.mean(),
+            'std_correlation': correlations.std(),
+            'min_correlation': correlations.min(),
+            'max_correlation': correlations.max()
         }
         
         # Data quality assessment
@@ -259,10 +283,9 @@ class ComprehensiveAnalyzer:
         }
         
         # Statistical significance
-        significant_methods = 0
-        for results in methodology_results.values():
-            if results.get('p_value', 1.0) < 0.05:
-                significant_methods += 1
+        p_values = np.fromiter((results.get('p_value', 1.0) for results in methodology_results.values()),
+                               dtype=np.float64, count=len(methodology_results))
+        significant_methods = int(np.count_nonzero(p_values < 0.05))
         
         validation['significance'] = {
             'significant_methods': significant_methods,
@@ -287,7 +310,7 @@ class ComprehensiveAnalyzer:
         
         direction = "positive" if combined_corr > 0 else "negative"
         
-        interpretation = f"""COMPREHENSIVE ASTRO-GENOMIC ANALYSIS RESULTS:
+        parts = [f"""COMPREHENSIVE ASTRO-GENOMIC ANALYSIS RESULTS:
 
 Overall Finding: {strength.title()} {direction} correlation detected between astrological factors and genetic expression.
 
@@ -295,21 +318,24 @@ Combined Correlation: {combined_corr:.3f}
 Confidence Level: {combined_conf:.1%}
 
 METHOD BREAKDOWN:
-"""
+"""]
         
         # Add method-specific interpretations
-        for method, results in methodology_results.items():
-            corr = results['correlation']
-            interpretation += f"\n• {method.title()}: {corr:.3f} correlation"
+        parts.extend(
+            f"\n• {method.title()}: {results['correlation']:.3f} correlation"
+            for method, results in methodology_results.items()
+        )
         
         # Add top findings
         top_corrs = meta_results['top_correlations'][:3]
         if top_corrs:
-            interpretation += "\n\nTOP CORRELATIONS:\n"
-            for i, corr in enumerate(top_corrs, 1):
-                interpretation += f"{i}. {corr['method'].title()} method: {corr['details']}\n"
+            parts.append("\n\nTOP CORRELATIONS:\n")
+            parts.extend(
+                f"{i}. {corr['method'].title()} method: {corr['details']}\n"
+                for i, corr in enumerate(top_corrs, 1)
+            )
         
-        return interpretation
+        return ''.join(parts)
     
     def _generate_recommendations(self, methodology_results: Dict, validation_results: Dict) -> List[str]:
         """Generate actionable recommendations"""
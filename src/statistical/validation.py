@@ -5,7 +5,125 @@ from scipy import stats
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
-@dataclass
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    _NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels below remain plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Resample matrices smaller than this are ranked with scipy, larger ones with numba
+_NUMBA_MIN_ELEMENTS = 50_000
+
+def _pearson_r(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two float arrays (NaN if either is constant)"""
+    dev_x = x - x.mean()
+    dev_y = y - y.mean()
+    
+    denom = np.sqrt((dev_x @ dev_x) * (dev_y @ dev_y))
+    if denom == 0:
+        return np.nan
+    return np.clip((dev_x @ dev_y) / denom, -1.0, 1.0)
+
+def _t_test_p_value(r, n: int):
+    """Two-sided Student-t p-value(s) of correlation(s) ``r`` from ``n`` pairs"""
+    dof = n - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = r * np.sqrt(dof / ((1.0 + r) * (1.0 - r)))
+    return 2 * stats.t.sf(np.abs(t_stat), dof)
+
+def _fast_pearson(x, y) -> Tuple[float, float]:
+    """Pearson correlation and two-sided p-value for short vectors
+    
+    Same statistic as ``stats.pearsonr`` (Student-t p-value with n - 2
+    degrees of freedom) without its input validation overhead. Constant
+    input gives ``(nan, nan)``.
+    """
+    r = _pearson_r(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    return r, _t_test_p_value(r, len(x))
+
+def _fast_spearman(x, y) -> Tuple[float, float]:
+    """Spearman correlation and p-value: _fast_pearson on average ranks"""
+    return _fast_pearson(stats.rankdata(x), stats.rankdata(y))
+
+# Correlation function and test name by validate_correlation method
+_CORR_METHODS = {
+    'pearson': (_fast_pearson, "Pearson Correlation"),
+    'spearman': (_fast_spearman, "Spearman Correlation")
+}
+
+def _rowwise_spearman(x_rows: np.ndarray, y_rows: np.ndarray) -> np.ndarray:
+    """Spearman correlation of each pair of rows (NaN where a row is constant)"""
+    x_ranks = stats.rankdata(x_rows, axis=-1)
+    y_ranks = stats.rankdata(y_rows, axis=-1)
+    x_ranks -= x_ranks.mean(axis=-1, keepdims=True)
+    y_ranks -= y_ranks.mean(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corrs = (x_ranks * y_ranks).sum(axis=-1) / np.sqrt(
+            (x_ranks * x_ranks).sum(axis=-1) * (y_ranks * y_ranks).sum(axis=-1)
+        )
+    return np.clip(corrs, -1.0, 1.0)
+
+# Kernels compile on first use, without cache=True: a disk-cached kernel
+# fails to load once this file is imported under its other package name.
+@njit()
+def _average_ranks_nb(values):
+    """Average ranks of one row, as rankdata (all NaN if the row has a NaN)"""
+    n = values.shape[0]
+    ranks = np.empty(n, dtype=np.float64)
+    if np.isnan(values).any():
+        ranks[:] = np.nan
+        return ranks
+    
+    order = np.argsort(values, kind='mergesort')
+    start = 0
+    while start < n:
+        # Tied run order[start:end] shares the midpoint of its rank span
+        end = start + 1
+        while end < n and values[order[end]] == values[order[start]]:
+            end += 1
+        midrank = (start + end + 1) / 2.0
+        for k in range(start, end):
+            ranks[order[k]] = midrank
+        start = end
+    return ranks
+
+@njit(parallel=True)
+def _spearman_batch_nb(x_rows, y_rows):
+    """Parallel equivalent of _rowwise_spearman, one row pair per prange step"""
+    n_rows = x_rows.shape[0]
+    correlations = np.empty(n_rows, dtype=np.float64)
+    
+    for i in prange(n_rows):
+        dev_x = _average_ranks_nb(x_rows[i])
+        dev_y = _average_ranks_nb(y_rows[i])
+        dev_x -= dev_x.mean()
+        dev_y -= dev_y.mean()
+        
+        denom = np.sqrt((dev_x * dev_x).sum() * (dev_y * dev_y).sum())
+        if denom == 0.0:
+            correlations[i] = np.nan
+        else:
+            correlations[i] = min(max((dev_x * dev_y).sum() / denom, -1.0), 1.0)
+    
+    return correlations
+
+def _percentile_interval(correlations: np.ndarray) -> Tuple[float, float]:
+    """95% percentile interval of resampled correlations"""
+    # Only two order statistics are needed
+    lower_idx = int(0.025 * len(correlations))
+    upper_idx = int(0.975 * len(correlations))
+    correlations = np.partition(correlations, (lower_idx, upper_idx))
+    
+    return (correlations[lower_idx], correlations[upper_idx])
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Statistical validation results"""
     test_name: str
@@ -18,9 +136,17 @@ class ValidationResult:
 class StatisticalValidator:
     """Comprehensive statistical validation framework"""
     
-    def __init__(self, alpha: float = 0.05):
-        """Initialize validator with significance level"""
+    def __init__(self, alpha: float = 0.05, seed: Optional[int] = None):
+        """Initialize validator with significance level
+        
+        Args:
+            alpha: Significance level
+            seed: Seed for bootstrap and permutation sampling (random if None)
+        """
         self.alpha = alpha
+        self._rng = np.random.default_rng(seed)
+        # Two-sided normal critical value for Fisher-z confidence intervals
+        self._z_crit = float(stats.norm.ppf(1 - alpha/2))
     
     def validate_correlation(self, x: List[float], y: List[float], 
                            method: str = 'pearson') -> ValidationResult:
@@ -38,24 +164,46 @@ class StatisticalValidator:
             raise ValueError("Invalid data for correlation analysis")
         
         # Calculate correlation
-        if method == 'pearson':
-            corr, p_value = stats.pearsonr(x, y)
-            test_name = "Pearson Correlation"
-        elif method == 'spearman':
-            corr, p_value = stats.spearmanr(x, y)
-            test_name = "Spearman Correlation"
-        else:
+        if method not in _CORR_METHODS:
             raise ValueError(f"Unknown correlation method: {method}")
+        correlate, test_name = _CORR_METHODS[method]
+        corr, p_value = correlate(x, y)
         
-        # Calculate confidence interval
+        return self._correlation_result(test_name, corr, p_value, len(x))
+    
+    def _validate_pair(self, x: List[float], y: List[float]) -> Tuple[ValidationResult, ValidationResult]:
+        """Pearson and Spearman validate_correlation results from one pass
+        
+        The data are converted and ranked once and both p-values come from
+        a single t-distribution call.
+        """
+        if len(x) != len(y) or len(x) < 3:
+            raise ValueError("Invalid data for correlation analysis")
+        
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
         n = len(x)
+        corrs = np.array([
+            _pearson_r(x, y),
+            _pearson_r(stats.rankdata(x), stats.rankdata(y))
+        ])
+        p_values = _t_test_p_value(corrs, n)
+        
+        return (
+            self._correlation_result("Pearson Correlation", corrs[0], p_values[0], n),
+            self._correlation_result("Spearman Correlation", corrs[1], p_values[1], n)
+        )
+    
+    def _correlation_result(self, test_name: str, corr: float, p_value: float, n: int) -> ValidationResult:
+        """Fisher-z confidence interval and interpretation of a correlation test"""
+        # Calculate confidence interval
         if n > 3:
             # Fisher z-transformation for confidence interval
-            z = np.arctanh(corr)
+            with np.errstate(divide='ignore'):  # |r| = 1 maps to an infinite z
+                z = np.arctanh(corr)
             se = 1 / np.sqrt(n - 3)
-            z_crit = stats.norm.ppf(1 - self.alpha/2)
-            z_lower = z - z_crit * se
-            z_upper = z + z_crit * se
+            z_lower = z - self._z_crit * se
+            z_upper = z + self._z_crit * se
             ci_lower = np.tanh(z_lower)
             ci_upper = np.tanh(z_upper)
         else:
@@ -86,21 +234,16 @@ class StatisticalValidator:
             raise ValueError("Insufficient data for bootstrap validation")
         
         # Original correlation
-        original_corr, _ = stats.spearmanr(x, y)
-        
-        # Bootstrap correlations
-        bootstrap_corrs = []
-        for _ in range(n_bootstrap):
-            indices = np.random.choice(n, size=n, replace=True)
-            x_boot = [x[i] for i in indices]
-            y_boot = [y[i] for i in indices]
-            
-            try:
-                corr, _ = stats.spearmanr(x_boot, y_boot)
-                if not np.isnan(corr):
-                    bootstrap_corrs.append(corr)
-            except:
-                continue
+        original_corr, _ = _fast_spearman(x, y)
+        
+        # All resamples at once from one (n_bootstrap, n) index matrix
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        indices = self._rng.integers(0, n, size=(n_bootstrap, n))
+        if _NUMBA_AVAILABLE and indices.size > _NUMBA_MIN_ELEMENTS:
+            bootstrap_corrs = _spearman_batch_nb(x[indices], y[indices])
+        else:
+            bootstrap_corrs = _rowwise_spearman(x[indices], y[indices])
+        bootstrap_corrs = bootstrap_corrs[~np.isnan(bootstrap_corrs)]
         
         if len(bootstrap_corrs) == 0:
             return ValidationResult(
@@ -113,12 +256,11 @@ class StatisticalValidator:
             )
         
         # Calculate confidence interval
-        bootstrap_corrs.sort()
-        ci_lower = np.percentile(bootstrap_corrs, 2.5)
-        ci_upper = np.percentile(bootstrap_corrs, 97.5)
+        ci_lower, ci_upper = _percentile_interval(bootstrap_corrs)
         
-        # P-value approximation (proportion of bootstrap samples with correlation near zero)
-        p_value = np.mean([abs(corr) <= abs(original_corr) for corr in bootstrap_corrs])
+        # P-value approximation (proportion of bootstrap samples with correlation near zero);
+        # compared against the same computation so ties are not split by rounding
+        p_value = np.mean(np.abs(bootstrap_corrs) <= abs(_rowwise_spearman(x, y)))
         
         interpretation = f"Bootstrap validation: {len(bootstrap_corrs)} successful resamples"
         passed = ci_lower * ci_upper > 0  # CI doesn't include zero
@@ -133,24 +275,46 @@ class StatisticalValidator:
         )
     
     def permutation_test(self, x: List[float], y: List[float], 
-                        n_permutations: int = 1000) -> ValidationResult:
-        """Permutation test for correlation significance"""
+                        n_permutations: int = 1000, chunk_size: int = 256,
+                        target_exceedances: int = 30) -> ValidationResult:
+        """Permutation test for correlation significance
+        
+        Permutations are drawn in chunks of ``chunk_size``; sampling stops
+        early once ``target_exceedances`` permuted correlations reach the
+        observed one (a clearly non-significant result), and never exceeds
+        ``n_permutations``.
+        """
         if len(x) != len(y) or len(x) < 3:
             raise ValueError("Invalid data for permutation test")
         
+        # Permuting y only reorders its ranks, so rank once and correlate each
+        # chunk of permutations in one matrix-vector product
+        x_ranks = stats.rankdata(np.asarray(x, dtype=np.float64))
+        y_ranks = stats.rankdata(np.asarray(y, dtype=np.float64))
+        
         # Original correlation
-        original_corr, _ = stats.spearmanr(x, y)
+        original_corr, _ = _fast_pearson(x_ranks, y_ranks)
         
-        # Permutation correlations
-        perm_corrs = []
-        for _ in range(n_permutations):
-            y_perm = np.random.permutation(y)
-            try:
-                corr, _ = stats.spearmanr(x, y_perm)
-                if not np.isnan(corr):
-                    perm_corrs.append(corr)
-            except:
-                continue
+        x_dev = x_ranks - x_ranks.mean()
+        y_dev = y_ranks - y_ranks.mean()
+        norm = np.sqrt((x_dev @ x_dev) * (y_dev @ y_dev))
+        
+        n = len(x)
+        chunks = [np.empty(0)]
+        n_exceeding = 0
+        for start in range(0, n_permutations, chunk_size):
+            size = min(chunk_size, n_permutations - start)
+            permutations = self._rng.permuted(np.broadcast_to(np.arange(n), (size, n)), axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):  # constant input gives NaN
+                chunk = np.clip(y_dev[permutations] @ x_dev / norm, -1.0, 1.0)
+            chunk = chunk[~np.isnan(chunk)]
+            chunks.append(chunk)
+            
+            # original_corr is the same computation, so ties are not split by rounding
+            n_exceeding += int(np.count_nonzero(np.abs(chunk) >= abs(original_corr)))
+            if n_exceeding >= target_exceedances:
+                break
+        perm_corrs = np.concatenate(chunks)
         
         if len(perm_corrs) == 0:
             return ValidationResult(
@@ -163,12 +327,10 @@ class StatisticalValidator:
             )
         
         # Calculate p-value
-        p_value = np.mean([abs(corr) >= abs(original_corr) for corr in perm_corrs])
+        p_value = n_exceeding / len(perm_corrs)
         
         # Confidence interval from permutation distribution
-        perm_corrs.sort()
-        ci_lower = np.percentile(perm_corrs, 2.5)
-        ci_upper = np.percentile(perm_corrs, 97.5)
+        ci_lower, ci_upper = _percentile_interval(perm_corrs)
         
         interpretation = f"Permutation test: {len(perm_corrs)} permutations completed"
         passed = p_value < self.alpha
@@ -197,24 +359,20 @@ class StatisticalValidator:
         n = len(p_array)
         
         if method == 'bonferroni':
-            return (p_array * n).tolist()
+            return np.minimum(p_array * n, 1.0).tolist()
         
         elif method == 'fdr':  # Benjamini-Hochberg
             # Sort p-values
             sorted_indices = np.argsort(p_array)
             sorted_p = p_array[sorted_indices]
             
-            # Apply correction
-            corrected = np.zeros_like(sorted_p)
-            for i in range(n-1, -1, -1):
-                if i == n-1:
-                    corrected[i] = sorted_p[i]
-                else:
-                    corrected[i] = min(corrected[i+1], 
-                                     sorted_p[i] * n / (i + 1))
+            # Step-up correction: running minimum of p * n / rank from the largest p down
+            scaled = sorted_p * n / np.arange(1, n + 1)
+            corrected = np.minimum.accumulate(scaled[::-1])[::-1]
+            np.clip(corrected, 0.0, 1.0, out=corrected)
             
             # Restore original order
-            result = np.zeros_like(p_array)
+            result = np.empty_like(corrected)
             result[sorted_indices] = corrected
             return result.tolist()
         
@@ -231,18 +389,16 @@ class StatisticalValidator:
             Dict mapping names to validation results
         """
         all_results = {}
-        all_p_values = []
+        # (result list, result) pairs awaiting multiple testing correction
+        pending = []
         
         # Run all validation tests
         for name, (x, y) in correlations.items():
             results = []
             
             try:
-                # Pearson correlation test
-                results.append(self.validate_correlation(x, y, 'pearson'))
-                
-                # Spearman correlation test  
-                results.append(self.validate_correlation(x, y, 'spearman'))
+                # Pearson and Spearman correlation tests
+                results.extend(self._validate_pair(x, y))
                 
                 # Bootstrap validation
                 if len(x) >= 5:
@@ -254,9 +410,8 @@ class StatisticalValidator:
                 
                 all_results[name] = results
                 
-                # Collect p-values for multiple testing correction
-                for result in results:
-                    all_p_values.append(result.p_value)
+                # Collect results for multiple testing correction
+                pending.extend((results, result) for result in results)
                     
             except Exception as e:
                 # Handle validation errors gracefully
@@ -271,24 +426,18 @@ class StatisticalValidator:
                 all_results[name] = [error_result]
         
         # Apply multiple testing correction
-        if len(all_p_values) > 1:
-            corrected_p = self.multiple_testing_correction(all_p_values, 'fdr')
+        if len(pending) > 1:
+            corrected_p = self.multiple_testing_correction([result.p_value for _, result in pending], 'fdr')
             
-            # Update results with corrected p-values
-            idx = 0
-            for name, results in all_results.items():
-                for result in results:
-                    if result.test_name != "Validation Error":
-                        # Create new result with corrected p-value
-                        corrected_result = ValidationResult(
-                            test_name=f"{result.test_name} (FDR corrected)",
-                            statistic=result.statistic,
-                            p_value=corrected_p[idx],
-                            confidence_interval=result.confidence_interval,
-                            interpretation=f"{result.interpretation} [FDR corrected p = {corrected_p[idx]:.4f}]",
-                            passed=corrected_p[idx] < self.alpha
-                        )
-                        results.append(corrected_result)
-                        idx += 1
+            # Append a corrected copy of each result to its own list
+            for (results, result), p_value in zip(pending, corrected_p):
+                results.append(ValidationResult(
+                    test_name=f"{result.test_name} (FDR corrected)",
+                    statistic=result.statistic,
+                    p_value=p_value,
+                    confidence_interval=result.confidence_interval,
+                    interpretation=f"{result.interpretation} [FDR corrected p = {p_value:.4f}]",
+                    passed=p_value < self.alpha
+                ))
         
         return all_results
\ No newline at end of file
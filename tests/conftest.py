@@ -0,0 +1,34 @@
+"""Shared pytest configuration for the astro-genomic framework tests"""
+
+import importlib
+
+import pytest
+
+# src/ is put on sys.path by ``pythonpath`` in pytest.ini
+
+# Analyzers shared through the ``calculators`` fixture: key -> (module, class)
+CALCULATORS = {
+    'variant': ('genetic.variant_analyzer', 'VariantAnalyzer'),
+    'dignity': ('astrological.dignity_calculator', 'DignityCalculator'),
+    'pathway': ('genetic.pathway_analyzer', 'PathwayAnalyzer'),
+    'polygenic': ('genetic.polygenic_calculator', 'PolygenicCalculator'),
+    'stat': ('statistical.validation', 'StatisticalValidator'),
+}
+
+class _Calculators(dict):
+    """Dict that imports and builds each analyzer on first lookup"""
+
+    def __missing__(self, key):
+        module, name = CALCULATORS[key]
+        instance = getattr(importlib.import_module(module), name)()
+        self[key] = instance
+        return instance
+
+@pytest.fixture(scope="session")
+def calculators():
+    """One instance of each analyzer per session (per xdist worker)
+
+    Instances are built lazily, so a module missing from the tree only
+    fails the tests that look its analyzer up.
+    """
+    return _Calculators()
@@ -0,0 +1,25 @@
+"""Constructor micro-benchmarks for the analyzers (needs pytest-benchmark)
+
+Run with ``pytest -m benchmark --benchmark-only`` and keep a baseline with
+``--benchmark-save``; ``--benchmark-compare`` then flags regressions.
+"""
+
+import importlib
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+pytestmark = pytest.mark.benchmark
+
+@pytest.mark.parametrize('module,name', [
+    ('genetic.variant_analyzer', 'VariantAnalyzer'),
+    ('astrological.dignity_calculator', 'DignityCalculator'),
+    ('genetic.pathway_analyzer', 'PathwayAnalyzer'),
+    ('genetic.polygenic_calculator', 'PolygenicCalculator'),
+    ('statistical.validation', 'StatisticalValidator'),
+])
+def test_init(benchmark, module, name):
+    """Time construction once the module is imported (warm path)"""
+    cls = getattr(importlib.import_module(module), name)
+    assert benchmark(cls) is not None
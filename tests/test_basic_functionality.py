@@ -1,136 +1,172 @@
 #!/usr/bin/env python3
 """Basic functionality tests for the astro-genomic framework"""
 
-import sys
-import os
-import unittest
+import importlib
+import importlib.util
 from datetime import datetime
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import numpy as np
+import pytest
 
-class TestBasicFunctionality(unittest.TestCase):
+@pytest.fixture(scope="module")
+def corr_data():
+    """Perfectly correlated float64 samples, built once per module"""
+    x = np.arange(1, 6, dtype=np.float64)
+    return x, 2.0 * x
+
+class TestBasicFunctionality:
     """Test basic functionality without external dependencies"""
     
-    def test_imports(self):
-        """Test that all modules can be imported"""
-        try:
-            from astrological.chart_calculator import ChartCalculator
-            from astrological.dignity_calculator import DignityCalculator
-            from genetic.variant_analyzer import VariantAnalyzer
-            from genetic.pathway_analyzer import PathwayAnalyzer
-            from genetic.polygenic_calculator import PolygenicCalculator
-            from correlation.dignity_correlation import DignityCorrelation
-            from correlation.pathway_correlation import PathwayCorrelation
-            from statistical.validation import StatisticalValidator
-            from integration.comprehensive_analysis import ComprehensiveAnalyzer
-            
-            print("✅ All modules imported successfully")
-        except ImportError as e:
-            self.fail(f"Failed to import modules: {e}")
-    
-    def test_variant_analyzer_initialization(self):
+    @pytest.mark.parametrize('modname', [
+        'astrological.chart_calculator',
+        'astrological.dignity_calculator',
+        'genetic.variant_analyzer',
+        'genetic.pathway_analyzer',
+        'genetic.polygenic_calculator',
+        'correlation.dignity_correlation',
+        'correlation.pathway_correlation',
+        'statistical.validation',
+    ])
+    def test_import(self, modname):
+        """Test that each module can be imported"""
+        importlib.import_module(modname)
+    
+    @pytest.mark.xdist_group('integration')
+    def test_integration_importable(self):
+        """Test that the integration layer can be located"""
+        # Only locate it; importing pulls in the whole analysis stack,
+        # which test_comprehensive_analyzer_initialization covers
+        assert importlib.util.find_spec('integration.comprehensive_analysis') is not None
+    
+    @pytest.mark.xdist_group('genetic')
+    def test_variant_analyzer_initialization(self, calculators):
         """Test variant analyzer can be initialized"""
-        from genetic.variant_analyzer import VariantAnalyzer
-        
-        analyzer = VariantAnalyzer()
-        self.assertIsNotNone(analyzer)
-        self.assertTrue(len(analyzer.variant_db) > 0)
-        print(f"✅ VariantAnalyzer initialized with {len(analyzer.variant_db)} variants")
+        analyzer = calculators['variant']
+        assert analyzer is not None
+        assert len(analyzer.variant_db) > 0
     
-    def test_dignity_calculator_initialization(self):
+    @pytest.mark.xdist_group('astrological')
+    def test_dignity_calculator_initialization(self, calculators):
         """Test dignity calculator can be initialized"""
-        from astrological.dignity_calculator import DignityCalculator
-        
-        calc = DignityCalculator()
-        self.assertIsNotNone(calc)
-        self.assertTrue(len(calc.DOMICILES) > 0)
-        print("✅ DignityCalculator initialized successfully")
+        calc = calculators['dignity']
+        assert calc is not None
+        assert len(calc.DOMICILES) > 0
     
-    def test_pathway_analyzer_initialization(self):
+    @pytest.mark.xdist_group('genetic')
+    def test_pathway_analyzer_initialization(self, calculators):
         """Test pathway analyzer can be initialized"""
-        from genetic.pathway_analyzer import PathwayAnalyzer
-        
-        analyzer = PathwayAnalyzer()
-        self.assertIsNotNone(analyzer)
-        self.assertTrue(len(analyzer.PLANETARY_RULERSHIPS) > 0)
-        print(f"✅ PathwayAnalyzer initialized with {len(analyzer.PLANETARY_RULERSHIPS)} planetary rulerships")
+        analyzer = calculators['pathway']
+        assert analyzer is not None
+        assert len(analyzer.PLANETARY_RULERSHIPS) > 0
     
-    def test_polygenic_calculator_initialization(self):
+    @pytest.mark.xdist_group('genetic')
+    def test_polygenic_calculator_initialization(self, calculators):
         """Test polygenic calculator can be initialized"""
-        from genetic.polygenic_calculator import PolygenicCalculator
-        
-        calc = PolygenicCalculator()
-        self.assertIsNotNone(calc)
-        self.assertTrue(len(calc.PRS_WEIGHTS) > 0)
-        print(f"✅ PolygenicCalculator initialized with {len(calc.PRS_WEIGHTS)} trait definitions")
+        calc = calculators['polygenic']
+        assert calc is not None
+        assert len(calc.PRS_WEIGHTS) > 0
     
-    def test_statistical_validator_initialization(self):
+    @pytest.mark.xdist_group('statistical')
+    def test_statistical_validator_initialization(self, calculators):
         """Test statistical validator can be initialized"""
-        from statistical.validation import StatisticalValidator
-        
-        validator = StatisticalValidator()
-        self.assertIsNotNone(validator)
-        self.assertEqual(validator.alpha, 0.05)
-        print("✅ StatisticalValidator initialized successfully")
+        validator = calculators['stat']
+        assert validator is not None
+        assert validator.alpha == 0.05
     
+    @pytest.mark.xdist_group('integration')
     def test_comprehensive_analyzer_initialization(self):
         """Test comprehensive analyzer can be initialized"""
-        try:
-            from integration.comprehensive_analysis import ComprehensiveAnalyzer
-            
-            analyzer = ComprehensiveAnalyzer()
-            self.assertIsNotNone(analyzer)
-            print("✅ ComprehensiveAnalyzer initialized successfully")
-        except Exception as e:
-            print(f"⚠️  ComprehensiveAnalyzer initialization limited: {e}")
-            # This is expected without full dependencies
-    
-    def test_sample_genetic_data_processing(self):
-        """Test processing of sample genetic data"""
-        from genetic.variant_analyzer import VariantAnalyzer, GeneticVariant
-        
-        # Create sample data
-        sample_variants = {
-            'rs4680': GeneticVariant(
-                rsid='rs4680',
-                chromosome='22',
-                position=19963748,
-                genotype='AA',
-                effect_size=0.8,
-                clinical_significance='moderate',
-                gene='COMT',
-                pathway='neurotransmitter'
-            )
-        }
+        # Skipped, rather than passed, without the full dependency stack
+        comprehensive_analysis = pytest.importorskip(
+            'integration.comprehensive_analysis', exc_type=ImportError
+        )
         
-        analyzer = VariantAnalyzer()
+        analyzer = comprehensive_analysis.ComprehensiveAnalyzer()
+        assert analyzer is not None
+    
+    @pytest.mark.xdist_group('genetic')
+    def test_sample_genetic_data_processing(self, calculators):
+        """Test processing of sample genetic data"""
+        analyzer = calculators['variant']
         
         # Test variant database lookup
-        self.assertIn('rs4680', analyzer.variant_db)
-        self.assertEqual(analyzer.variant_db['rs4680']['gene'], 'COMT')
+        assert 'rs4680' in analyzer.variant_db
+        assert analyzer.variant_db['rs4680']['gene'] == 'COMT'
+    
+    @pytest.mark.xdist_group('genetic')
+    @pytest.mark.parametrize('pyarrow', [True, False])
+    def test_genotype_file_parsing(self, calculators, monkeypatch, tmp_path, pyarrow):
+        """Test both genotype readers keep good rows around malformed ones"""
+        from genetic import variant_analyzer
         
-        print("✅ Sample genetic data processing works")
+        if pyarrow and not variant_analyzer._PYARROW_AVAILABLE:
+            pytest.skip('pyarrow is not installed')
+        monkeypatch.setattr(variant_analyzer, '_PYARROW_AVAILABLE', pyarrow)
+        analyzer = calculators['variant']
+        
+        raw = tmp_path / 'sample.txt'
+        raw.write_text(
+            '# rsid\tchromosome\tposition\tgenotype\n'
+            'rs1\t1\n'                      # too few fields, on the first data line
+            'rs4680\t22\t19963748\tAG\n'
+            'rs6265\t11\t27679916\tC"T\n'  # stray quote
+            'rs1800497\t11\t113400106\tAA\n'
+        )
+        profile = analyzer.load_genetic_data(str(raw))
+        assert profile.sample_id == 'sample'
+        assert profile.total_snps_processed == 4
+        assert {rsid: (v.position, v.genotype) for rsid, v in profile.variants.items()} == {
+            'rs4680': (19963748, 'AG'),
+            'rs6265': (27679916, 'C"T'),
+            'rs1800497': (113400106, 'AA'),
+        }
+        
+        # Non-integer positions are rejected, as by the line-by-line parser
+        raw.write_text('rs4680\t22\t1.5\tAG\n')
+        assert analyzer.load_genetic_data(str(raw)).sample_id == 'unknown'
     
-    def test_statistical_validation_functions(self):
-        """Test statistical validation with sample data"""
-        from statistical.validation import StatisticalValidator
+    @pytest.mark.xdist_group('genetic')
+    @pytest.mark.parametrize('genotype,risk_allele,numeric,category', [
+        ('AA', 'A', 2, 'extreme'),
+        ('AG', 'A', 1, 'intermediate'),
+        ('GG', 'A', 0, 'sensitive'),
+        ('ag', 'A', 1, 'intermediate'),
+        ('AG', None, 1, 'intermediate'),
+        ('AA', None, None, None),
+        ('--', 'A', None, None),
+    ])
+    def test_genetic_variant_dataclass(self, genotype, risk_allele, numeric, category):
+        """Test GeneticVariant fields and derived genotype classification"""
+        from genetic.variant_analyzer import GeneticVariant
         
-        validator = StatisticalValidator()
+        variant = GeneticVariant(
+            rsid='rs4680',
+            chromosome='22',
+            position=19963748,
+            genotype=genotype,
+            effect_size=0.8,
+            clinical_significance='moderate',
+            gene='COMT',
+            pathway='neurotransmitter',
+            risk_allele=risk_allele
+        )
         
-        # Sample data for testing
-        x = [1.0, 2.0, 3.0, 4.0, 5.0]
-        y = [2.0, 4.0, 6.0, 8.0, 10.0]  # Perfect correlation
+        assert variant.rsid == 'rs4680'
+        assert variant.gene == 'COMT'
+        assert variant.numeric_genotype == numeric
+        assert variant.genotype_category == category
+    
+    @pytest.mark.xdist_group('statistical')
+    def test_statistical_validation_functions(self, calculators, corr_data):
+        """Test statistical validation with sample data"""
+        validator = calculators['stat']
+        x, y = corr_data  # Perfect correlation
         
-        try:
-            result = validator.validate_correlation(x, y, 'pearson')
-            self.assertIsNotNone(result)
-            self.assertAlmostEqual(result.statistic, 1.0, places=10)  # Perfect correlation
-            print(f"✅ Statistical validation works: r = {result.statistic:.3f}")
-        except Exception as e:
-            print(f"⚠️  Statistical validation limited: {e}")
+        result = validator.validate_correlation(x, y, 'pearson')
+        assert result is not None
+        assert result.statistic == pytest.approx(1.0, abs=1e-10)  # Perfect correlation
     
+    @pytest.mark.xdist_group('genetic')
     def test_data_structures(self):
         """Test key data structures"""
         from genetic.variant_analyzer import GeneticProfile, GeneticVariant
@@ -149,8 +185,8 @@ class TestBasicFunctionality(unittest.TestCase):
             variants={'rs123': variant}
         )
         
-        self.assertEqual(profile.sample_id, 'test_sample')
-        self.assertIn('rs123', profile.variants)
+        assert profile.sample_id == 'test_sample'
+        assert 'rs123' in profile.variants
         
         # Test astrological structures
         planet_pos = PlanetPosition(
@@ -160,85 +196,118 @@ class TestBasicFunctionality(unittest.TestCase):
             speed=1.0
         )
         
-        self.assertEqual(planet_pos.longitude, 45.0)
-        
-        print("✅ Data structures work correctly")
-
-class TestMethodologyLogic(unittest.TestCase):
-    """Test the logic of individual methodologies"""
+        assert planet_pos.longitude == 45.0
     
-    def test_dignity_scoring_logic(self):
-        """Test dignity scoring logic"""
-        from astrological.dignity_calculator import DignityCalculator
-        
-        calc = DignityCalculator()
+    @pytest.mark.xdist_group('astrological')
+    @pytest.mark.parametrize('sign_id,sign', list(enumerate([
+        'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+        'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+    ])))
+    def test_planet_position_sign(self, sign_id, sign):
+        """Test PlanetPosition maps sign names to and from sign_id"""
+        from astrological.chart_calculator import PlanetPosition
         
-        # Test domicile recognition
-        self.assertIn('Leo', calc.DOMICILES['sun'])
-        self.assertIn('Cancer', calc.DOMICILES['moon'])
+        by_name = PlanetPosition(longitude=30.0 * sign_id, latitude=0.0, distance=1.0,
+                                 speed=1.0, sign=sign)
+        assert by_name.sign_id == sign_id
+        assert by_name.sign == sign
         
-        # Test detriment recognition
-        self.assertIn('Aquarius', calc.DETRIMENTS['sun'])
+        by_id = PlanetPosition(longitude=30.0 * sign_id, latitude=0.0, distance=1.0,
+                               speed=1.0, sign_id=sign_id)
+        assert by_id.sign == sign
+        assert by_id == by_name
         
-        print("✅ Dignity scoring logic is correct")
+        # Original positional order: ..., house, sign, degree_in_sign
+        positional = PlanetPosition(30.0 * sign_id, 0.0, 1.0, 1.0, 1, sign, 0.0)
+        assert (positional.house, positional.sign_id, positional.degree_in_sign) == (1, sign_id, 0.0)
     
-    def test_pathway_mapping_logic(self):
-        """Test pathway mapping logic"""
-        from genetic.pathway_analyzer import PathwayAnalyzer
-        
-        analyzer = PathwayAnalyzer()
+    @pytest.mark.xdist_group('astrological')
+    def test_planet_position_without_sign(self):
+        """Test PlanetPosition leaves the sign unset unless given"""
+        from astrological.chart_calculator import PlanetPosition
         
-        # Test planetary rulerships
-        mars_pathways = analyzer.PLANETARY_RULERSHIPS['mars']['pathways']
-        self.assertIn('inflammation', mars_pathways)
+        position = PlanetPosition(longitude=45.0, latitude=0.0, distance=1.0, speed=1.0)
+        assert position.sign is None and position.sign_id is None
+        with pytest.raises(ValueError):
+            PlanetPosition(longitude=45.0, latitude=0.0, distance=1.0, speed=1.0, sign='Leo', sign_id=0)
+
+    @pytest.mark.xdist_group('astrological')
+    def test_chart_planets_view(self):
+        """Test chart.planets returns read-only snapshots of the planet records"""
+        from dataclasses import FrozenInstanceError
+        from astrological.chart_calculator import ChartCalculator
         
-        mercury_pathways = analyzer.PLANETARY_RULERSHIPS['mercury']['pathways']
-        self.assertIn('neurotransmitter', mercury_pathways)
+        chart = ChartCalculator().calculate_chart(datetime(1990, 6, 15, 12, 0), 40.7, -74.0)
+        sun = chart.planets['sun']
         
-        print("✅ Pathway mapping logic is correct")
+        assert sun == chart.planets['sun']
+        assert sun is not chart.planets['sun']
+        assert sun.sign_id == chart.signs_idx[chart.planet_names.index('sun')]
+        with pytest.raises(FrozenInstanceError):
+            sun.house = 3
+        with pytest.raises(TypeError):
+            chart.planets['sun'] = sun
+
+class TestMethodologyLogic:
+    """Test the logic of individual methodologies"""
+    
+    @pytest.mark.xdist_group('astrological')
+    @pytest.mark.parametrize('table,planet,sign', [
+        # Domicile recognition
+        ('DOMICILES', 'sun', 'Leo'),
+        ('DOMICILES', 'moon', 'Cancer'),
+        # Detriment recognition
+        ('DETRIMENTS', 'sun', 'Aquarius'),
+    ])
+    def test_dignity_scoring_logic(self, calculators, table, planet, sign):
+        """Test dignity scoring logic"""
+        calc = calculators['dignity']
+        assert sign in getattr(calc, table)[planet]
+    
+    @pytest.mark.xdist_group('genetic')
+    @pytest.mark.parametrize('planet,pathway', [
+        ('mars', 'inflammation'),
+        ('mercury', 'neurotransmitter'),
+    ])
+    def test_pathway_mapping_logic(self, calculators, planet, pathway):
+        """Test pathway mapping logic"""
+        analyzer = calculators['pathway']
+        assert pathway in analyzer.PLANETARY_RULERSHIPS[planet]['pathways']
     
-    def test_polygenic_calculation_logic(self):
+    @pytest.mark.xdist_group('genetic')
+    def test_polygenic_calculation_logic(self, calculators):
         """Test polygenic calculation logic"""
-        from genetic.polygenic_calculator import PolygenicCalculator
-        
-        calc = PolygenicCalculator()
+        calc = calculators['polygenic']
         
         # Test trait definitions
-        self.assertIn('cardiovascular_disease', calc.PRS_WEIGHTS)
-        self.assertIn('cognitive_ability', calc.PRS_WEIGHTS)
+        assert 'cardiovascular_disease' in calc.PRS_WEIGHTS
+        assert 'cognitive_ability' in calc.PRS_WEIGHTS
         
-        # Test that weights are reasonable
+        # Test that weights are reasonable: a numeric (int/float) array,
+        # rather than the object/string dtype mixed values would give
         cv_weights = calc.PRS_WEIGHTS['cardiovascular_disease']
-        self.assertTrue(all(isinstance(w, (int, float)) for w in cv_weights.values()))
+        assert np.asarray(list(cv_weights.values())).dtype.kind in 'fi'
+    
+    def test_polygenic_custom_trait(self):
+        """Traits are added through add_custom_trait, not by editing trait_weights"""
+        from genetic.polygenic_calculator import PolygenicCalculator
+        from genetic.variant_analyzer import GeneticProfile, GeneticVariant
         
-        print("✅ Polygenic calculation logic is correct")
-
-if __name__ == '__main__':
-    print("Running Basic Functionality Tests")
-    print("=" * 40)
-    
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add test cases
-    suite.addTests(loader.loadTestsFromTestCase(TestBasicFunctionality))
-    suite.addTests(loader.loadTestsFromTestCase(TestMethodologyLogic))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    print("\n" + "=" * 40)
-    if result.wasSuccessful():
-        print("🎉 All tests passed! Framework is ready for use.")
-    else:
-        print(f"⚠️  {len(result.failures)} test(s) failed, {len(result.errors)} error(s)")
-        print("This may be expected without full dependencies.")
-    
-    print("\nFramework components tested:")
-    print("✅ Module imports")
-    print("✅ Core data structures")
-    print("✅ Analysis logic")
-    print("✅ Statistical validation")
-    print("✅ Integration framework")
\ No newline at end of file
+        calc = PolygenicCalculator()
+        with pytest.raises(TypeError):
+            calc.trait_weights['cognitive_ability'] = {'rs4680': 5.0}
+        
+        calc.add_custom_trait('test_trait', {'rs4680': 5.0}, {'mean': 0, 'std': 1})
+        profile = GeneticProfile('S1', {'rs4680': GeneticVariant('rs4680', '22', 19951271, 'AG')})
+        assert calc.calculate_prs(profile, 'test_trait').score == pytest.approx(5.0)
+        assert 'test_trait' not in PolygenicCalculator.PRS_WEIGHTS
+    
+    def test_polygenic_profile_edit(self, calculators):
+        """Replacing a scored variant invalidates the profile's cached encoding"""
+        from genetic.variant_analyzer import GeneticProfile, GeneticVariant
+        
+        calc = calculators['polygenic']
+        profile = GeneticProfile('S1', {'rs4680': GeneticVariant('rs4680', '22', 19951271, 'AG')})
+        before = calc.calculate_prs(profile, 'cognitive_ability').score
+        profile.variants['rs4680'] = GeneticVariant('rs4680', '22', 19951271, 'GG')
+        assert calc.calculate_prs(profile, 'cognitive_ability').score != before
\ No newline at end of file